@@ -52,6 +52,7 @@ _ConfigurationParseError = barectf_config_parse_common._ConfigurationParseError
 _EnumerationFieldType = barectf_config._EnumerationFieldType
 _FieldType = barectf_config._FieldType
 _IntegerFieldType = barectf_config._IntegerFieldType
+AUTO_FIELD_TYPE = barectf_config.AUTO_FIELD_TYPE
 ByteOrder = barectf_config.ByteOrder
 ClockType = barectf_config.ClockType
 ClockTypeCTypes = barectf_config.ClockTypeCTypes
@@ -67,6 +68,7 @@ EnumerationFieldTypeMapping = barectf_config.EnumerationFieldTypeMapping
 EnumerationFieldTypeMappingRange = barectf_config.EnumerationFieldTypeMappingRange
 EnumerationFieldTypeMappings = barectf_config.EnumerationFieldTypeMappings
 EventRecordType = barectf_config.EventRecordType
+FRAGMENT_EVENT_RECORD_TYPE_NAME = barectf_config.FRAGMENT_EVENT_RECORD_TYPE_NAME
 LogLevel = barectf_config.LogLevel
 RealFieldType = barectf_config.RealFieldType
 SignedEnumerationFieldType = barectf_config.SignedEnumerationFieldType
@@ -87,6 +89,7 @@ TraceTypeWithUnknownNativeByteOrder = barectf_config.TraceTypeWithUnknownNativeB
 TraceTypeFeatures = barectf_config.TraceTypeFeatures
 UnsignedEnumerationFieldType = barectf_config.UnsignedEnumerationFieldType
 UnsignedIntegerFieldType = barectf_config.UnsignedIntegerFieldType
+create_fragment_event_record_type = barectf_config.create_fragment_event_record_type
 
 
 # configuration file API
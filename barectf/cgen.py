@@ -25,7 +25,7 @@ import barectf.template as barectf_template
 import barectf.config as barectf_config
 import collections
 import copy
-from typing import List, Optional, Mapping, Callable, Any, Set, Tuple
+from typing import List, Optional, Mapping, Callable, Any, Set, Tuple, Dict
 import typing
 from barectf.typing import Count, Alignment
 
@@ -48,13 +48,17 @@ _OpTemplates = collections.namedtuple('_OpTemplates', ['serialize', 'size'])
 #
 # * Serialization and size computation templates to generate the
 #   operation's source code for those functions.
+#
+# * Whether or not its serialization source code uses a byte pointer
+#   (`cursor`) instead of the current offset (`ctx->at`).
 class _Op:
     def __init__(self, ft: barectf_config._FieldType, names: List[str], level: Count,
-                 templates: _OpTemplates):
+                 templates: _OpTemplates, uses_byte_ptr: bool = False):
         self._ft = ft
         self._names = copy.copy(names)
         self._level = level
         self._templates = templates
+        self._uses_byte_ptr = uses_byte_ptr
 
     @property
     def ft(self) -> barectf_config._FieldType:
@@ -72,6 +76,10 @@ class _Op:
     def top_name(self) -> str:
         return self._names[-1]
 
+    @property
+    def uses_byte_ptr(self) -> bool:
+        return self._uses_byte_ptr
+
     def _render_template(self, templ: barectf_template._Template, **kwargs) -> str:
         return templ.render(op=self, root_ft_prefixes=_RootFtPrefixes,
                             root_ft_prefix_names=_ROOT_FT_PREFIX_NAMES, **kwargs)
@@ -79,7 +87,12 @@ class _Op:
     def serialize_str(self, **kwargs) -> str:
         return self._render_template(self._templates.serialize, **kwargs)
 
+    # Operations without a size computation template don't contribute
+    # to the size computation function.
     def size_str(self, **kwargs) -> str:
+        if self._templates.size is None:
+            return ''
+
         return self._render_template(self._templates.size, **kwargs)
 
 
@@ -94,14 +107,27 @@ class _Op:
 # The templates of a compound operation handles its suboperations.
 class _CompoundOp(_Op):
     def __init__(self, ft: barectf_config._FieldType, names: List[str], level: Count,
-                 templates: _OpTemplates, subops: Optional[List[Any]] = None):
-        super().__init__(ft, names, level, templates)
+                 templates: _OpTemplates, subops: Optional[List[Any]] = None,
+                 uses_byte_ptr: bool = False):
+        super().__init__(ft, names, level, templates, uses_byte_ptr)
         self._subops = subops
 
     @property
     def subops(self):
         return self._subops
 
+    # Serialization source code strings of the suboperations, excluding
+    # empty ones.
+    def subop_serialize_strs(self, **kwargs) -> List[str]:
+        assert self._subops is not None
+        return [s for s in [subop.serialize_str(**kwargs) for subop in self._subops] if s]
+
+    # Size computation source code strings of the suboperations,
+    # excluding empty ones.
+    def subop_size_strs(self, **kwargs) -> List[str]:
+        assert self._subops is not None
+        return [s for s in [subop.size_str(**kwargs) for subop in self._subops] if s]
+
 
 # Leaf operation (abstract class).
 class _LeafOp(_Op):
@@ -111,8 +137,8 @@ class _LeafOp(_Op):
 # An "align" operation.
 class _AlignOp(_LeafOp):
     def __init__(self, ft: barectf_config._FieldType, names: List[str], level: Count,
-                 templates: _OpTemplates, value: Alignment):
-        super().__init__(ft, names, level, templates)
+                 templates: _OpTemplates, value: Alignment, uses_byte_ptr: bool = False):
+        super().__init__(ft, names, level, templates, uses_byte_ptr)
         self._value = value
 
     @property
@@ -121,21 +147,106 @@ class _AlignOp(_LeafOp):
 
 
 # A "write" operation.
+#
+# If `at_offset` is not `None`, then the operation writes its field at
+# `at_offset` bits after the current offset and doesn't update the
+# current offset (a subsequent "advance" operation does). Otherwise,
+# the operation writes at the current offset and updates it.
 class _WriteOp(_LeafOp):
     def __init__(self, ft: barectf_config._FieldType, names: List[str], level: Count,
-                 templates: _OpTemplates, offset_in_byte: Optional[Count]):
-        super().__init__(ft, names, level, templates)
+                 templates: _OpTemplates, offset_in_byte: Optional[Count],
+                 at_offset: Optional[Count] = None, uses_byte_ptr: bool = False):
+        super().__init__(ft, names, level, templates, uses_byte_ptr)
         assert offset_in_byte is None or (offset_in_byte >= 0 and offset_in_byte < 8)
         self._offset_in_byte = offset_in_byte
+        self._at_offset = at_offset
 
     @property
     def offset_in_byte(self) -> Optional[Count]:
         return self._offset_in_byte
 
+    @property
+    def at_offset(self) -> Optional[Count]:
+        return self._at_offset
+
+
+# An "advance" operation: adds `serialize_count` bits to the current
+# offset within a serialization function and `size_count` bits within
+# a size computation function.
+class _AdvanceOp(_LeafOp):
+    def __init__(self, ft: barectf_config._FieldType, names: List[str], level: Count,
+                 templates: _OpTemplates, serialize_count: Count, size_count: Count,
+                 uses_byte_ptr: bool = False):
+        super().__init__(ft, names, level, templates, uses_byte_ptr)
+        self._serialize_count = serialize_count
+        self._size_count = size_count
+
+    @property
+    def serialize_count(self) -> Count:
+        return self._serialize_count
+
+    @property
+    def size_count(self) -> Count:
+        return self._size_count
+
+
+# A "pack" operation: writes the fields of its "write" suboperations,
+# which are contiguous, statically positioned integer fields, at once
+# through a 64-bit register.
+#
+# The suboperations only provide the fields to pack: the templates of a
+# "pack" operation don't render them.
+#
+# The first packed field is at `at_offset` bits after the current
+# offset and at `offset_in_byte` bits within its first byte. The packed
+# fields cover `byte_count` bytes.
+#
+# `preserved_masks` maps byte indexes, from the first covered byte, to
+# the masks of the bits of such bytes which don't belong to any packed
+# field and must remain as is.
+class _PackOp(_CompoundOp):
+    def __init__(self, ft: barectf_config._FieldType, names: List[str], level: Count,
+                 templates: _OpTemplates, subops: List[_WriteOp], at_offset: Count,
+                 offset_in_byte: Count, byte_count: Count, preserved_masks: Mapping[int, int],
+                 uses_byte_ptr: bool = False):
+        super().__init__(ft, names, level, templates, subops, uses_byte_ptr)
+        self._at_offset = at_offset
+        self._offset_in_byte = offset_in_byte
+        self._byte_count = byte_count
+        self._preserved_masks = preserved_masks
+
+    @property
+    def at_offset(self) -> Count:
+        return self._at_offset
+
+    @property
+    def offset_in_byte(self) -> Count:
+        return self._offset_in_byte
+
+    @property
+    def byte_count(self) -> Count:
+        return self._byte_count
+
+    @property
+    def preserved_masks(self) -> Mapping[int, int]:
+        return self._preserved_masks
+
 
 _SpecSerializeWriteTemplates = Mapping[str, barectf_template._Template]
 
 
+# What an operation builder knows about an offset at generation time:
+# the offset is `offset` modulo `alignment`.
+#
+# `alignment` is 1 when nothing is known.
+_StaticAlignState = collections.namedtuple('_StaticAlignState', ['alignment', 'offset'])
+
+
+# `ctx->at` is a 32-bit value: knowing it modulo 2^32 means knowing it
+# exactly.
+_EXACT_ALIGNMENT = Alignment(2 ** 32)
+
+
 # An operation builder.
 #
 # Such a builder is closely connected to a `_CodeGen` object using it to
@@ -144,17 +255,358 @@ _SpecSerializeWriteTemplates = Mapping[str, barectf_template._Template]
 # Call build_for_root_ft() to make an operation builder create a
 # compound operation for a given root structure field type, recursively,
 # and return it.
+#
+# An operation builder tracks what it statically knows about the
+# current offset so that:
+#
+# * It only creates "align" operations when the padding size is not
+#   known at generation time.
+#
+# * Statically positioned "write" operations don't update the current
+#   offset themselves: they write at a known distance from it (see
+#   `_WriteOp.at_offset`) and a single "advance" operation updates it
+#   after a run of such fields.
+#
+# An operation builder also accumulates a static upper bound of the
+# total size (bits) of all the root field types it built operations for
+# (see the `size_upper_bound` property).
 class _OpBuilder:
-    def __init__(self, cg: '_CodeGen'):
+    def __init__(self, cg: '_CodeGen', offset: Optional[Count] = None,
+                 uses_byte_ptr: bool = False):
         self._names: List[str] = []
         self._level = Count(0)
-        self._offset_in_byte: Optional[Count] = None
+        self._size_upper_bound: Optional[Count] = Count(0)
+        self._uses_byte_ptr = uses_byte_ptr
+
+        # what's known about the current offset, including the pending
+        # bits below (`offset` is the exact initial offset, if known)
+        if offset is not None:
+            self._state = _StaticAlignState(_EXACT_ALIGNMENT, offset)
+        elif uses_byte_ptr:
+            # The byte pointer starts at the first byte boundary at or
+            # after the current offset: up to seven padding bits.
+            self._state = _StaticAlignState(Alignment(8), Count(0))
+            self._size_upper_bound = Count(7)
+        else:
+            self._state = _StaticAlignState(Alignment(1), Count(0))
+
+        # bits to add to the current offset (serialization and size
+        # computation functions) with the next "advance" operation
+        self._pending = Count(0)
+        self._size_pending = Count(0)
         self._cg = cg
 
-    # Whether or not we're within an array operation.
+    # Static upper bound of the total size (bits) of all the root field
+    # types this builder built operations for so far, or `None` if
+    # there's no such bound (some field type has a dynamic size).
+    @property
+    def size_upper_bound(self) -> Optional[Count]:
+        return self._size_upper_bound
+
+    # Offset of the current field within its first byte, or `None` if
+    # it's not known at generation time.
     @property
-    def _in_array(self):
-        return self._level > 0
+    def _offset_in_byte(self) -> Optional[Count]:
+        if self._state.alignment % 8 == 0:
+            return Count(self._state.offset % 8)
+
+        return None
+
+    # Returns the state after `size` bits from `state`.
+    @staticmethod
+    def _advance_state(state: _StaticAlignState, size: Count) -> _StaticAlignState:
+        return _StaticAlignState(state.alignment, Count((state.offset + size) % state.alignment))
+
+    # Returns the most precise state which is true for both `state_a`
+    # and `state_b`.
+    @staticmethod
+    def _meet_states(state_a: _StaticAlignState,
+                     state_b: _StaticAlignState) -> _StaticAlignState:
+        alignment = min(state_a.alignment, state_b.alignment)
+
+        while state_a.offset % alignment != state_b.offset % alignment:
+            alignment = Alignment(alignment // 2)
+
+        return _StaticAlignState(alignment, Count(state_a.offset % alignment))
+
+    # Returns the maximum number of padding bits needed to align an
+    # offset, described by `state`, to `alignment`, and the new state
+    # once aligned.
+    @staticmethod
+    def _max_align_padding(state: _StaticAlignState,
+                           alignment: Alignment) -> Tuple[Count, _StaticAlignState]:
+        if alignment <= state.alignment:
+            # exact padding
+            padding = Count(-state.offset % alignment)
+            return padding, _OpBuilder._advance_state(state, padding)
+
+        # worst case
+        if state.offset == 0:
+            padding = Count(alignment - state.alignment)
+        else:
+            padding = Count(alignment - state.offset)
+
+        return padding, _StaticAlignState(alignment, Count(0))
+
+    # Returns static information about a field having the type `ft` when
+    # its offset is described by `state`, that is:
+    #
+    # * A static upper bound of its size (bits), padding included, or
+    #   `None` if there's no such bound.
+    #
+    # * Whether or not this upper bound is the exact size of the field,
+    #   that is, all the padding sizes are known.
+    #
+    # * The state after such a field.
+    def _ft_static_info(self, ft: barectf_config._FieldType,
+                        state: _StaticAlignState) -> Tuple[Optional[Count], bool, _StaticAlignState]:
+        alignment = ft.alignment
+
+        if type(ft) is barectf_config.StringFieldType:
+            # strings are always byte-aligned
+            alignment = Alignment(8)
+
+        is_exact = alignment <= state.alignment
+        padding, state = self._max_align_padding(state, alignment)
+
+        if type(ft) is barectf_config.StringFieldType:
+            return None, False, _StaticAlignState(Alignment(8), Count(0))
+        elif isinstance(ft, barectf_config._BitArrayFieldType):
+            ft = typing.cast(barectf_config._BitArrayFieldType, ft)
+            return Count(padding + ft.size), is_exact, self._advance_state(state, ft.size)
+        elif type(ft) is barectf_config.StructureFieldType:
+            ft = typing.cast(barectf_config.StructureFieldType, ft)
+            bound: Optional[Count] = padding
+
+            for member in ft.members.values():
+                member_bound, member_is_exact, state = self._ft_static_info(member.field_type,
+                                                                            state)
+                is_exact = is_exact and member_is_exact
+
+                if bound is not None and member_bound is not None:
+                    bound = Count(bound + member_bound)
+                else:
+                    bound = None
+
+            return bound, is_exact and bound is not None, state
+
+        assert isinstance(ft, barectf_config._ArrayFieldType)
+        ft = typing.cast(barectf_config._ArrayFieldType, ft)
+        elem_ft = ft.element_field_type
+        elem_state = self._array_elem_state(elem_ft, state)
+
+        if type(ft) is barectf_config.DynamicArrayFieldType:
+            return None, False, elem_state
+
+        ft = typing.cast(barectf_config.StaticArrayFieldType, ft)
+
+        if ft.length == 0:
+            return padding, is_exact, state
+
+        # first element
+        first_bound, first_is_exact, first_state = self._ft_static_info(elem_ft, state)
+
+        if ft.length == 1:
+            bound = None if first_bound is None else Count(padding + first_bound)
+            return bound, is_exact and first_is_exact, first_state
+
+        # remaining elements
+        rem_bound, rem_is_exact, rem_state = self._ft_static_info(elem_ft, elem_state)
+
+        if first_bound is None or rem_bound is None:
+            return None, False, rem_state
+
+        return (Count(padding + first_bound + (ft.length - 1) * rem_bound),
+                is_exact and first_is_exact and rem_is_exact, rem_state)
+
+    # Returns the state at the beginning of any element of an array
+    # field of which the element field type is `elem_ft` and the first
+    # element's state is `state`.
+    def _array_elem_state(self, elem_ft: barectf_config._FieldType,
+                          state: _StaticAlignState) -> _StaticAlignState:
+        while True:
+            next_state = self._meet_states(state, self._ft_static_info(elem_ft, state)[2])
+
+            if next_state == state:
+                return state
+
+            state = next_state
+
+    # Creates and returns an "advance" operation for the field type `ft`
+    # adding the pending bits to the current offset, or returns `None`
+    # if there are no pending bits.
+    #
+    # If `serialize_only` is `True`, then only add the pending bits of
+    # the serialization function.
+    #
+    # This method updates the builder's state.
+    def _try_create_advance_op(self, ft: barectf_config._FieldType,
+                               serialize_only: bool = False) -> Optional['_AdvanceOp']:
+        size_count = Count(0) if serialize_only else self._size_pending
+
+        if self._pending == 0 and size_count == 0:
+            return None
+
+        op = _AdvanceOp(ft, self._names, self._level,
+                        _OpTemplates(self._cg._serialize_advance_statements_templ,
+                                     self._cg._size_advance_statements_templ),
+                        self._pending, size_count, self._uses_byte_ptr)
+        self._pending = Count(0)
+
+        if not serialize_only:
+            self._size_pending = Count(0)
+
+        return op
+
+    # Creates and returns the operations to align the current offset to
+    # `alignment` for the field type `ft`.
+    #
+    # Creates no operation when the padding size is known at generation
+    # time: it becomes pending bits.
+    #
+    # This method updates the builder's state.
+    def _create_align_ops(self, alignment: Alignment,
+                          ft: barectf_config._FieldType) -> List[_Op]:
+        if alignment <= self._state.alignment:
+            padding, self._state = self._max_align_padding(self._state, alignment)
+            self._pending = Count(self._pending + padding)
+            self._size_pending = Count(self._size_pending + padding)
+            return []
+
+        ops: List[_Op] = []
+        advance_op = self._try_create_advance_op(ft)
+
+        if advance_op is not None:
+            ops.append(advance_op)
+
+        ops.append(_AlignOp(ft, self._names, self._level,
+                            _OpTemplates(self._cg._serialize_align_statements_templ,
+                                         self._cg._size_align_statements_templ),
+                            alignment, self._uses_byte_ptr))
+        self._state = _StaticAlignState(alignment, Count(0))
+        return ops
+
+    # Returns whether or not the field type `ft` is an array field type
+    # of which the element field type is a byte-aligned 8-bit, 16-bit,
+    # 32-bit, or 64-bit integer or real field type, without padding
+    # between elements, in the native byte order.
+    #
+    # The memory layout of the C array parameter of such a field is the
+    # serialized layout of the field.
+    def _is_bulk_array_ft(self, ft: barectf_config._FieldType) -> bool:
+        if not isinstance(ft, barectf_config._ArrayFieldType):
+            return False
+
+        if type(self._cg._trace_type) is barectf_config.TraceTypeWithUnknownNativeByteOrder:
+            return False
+
+        ft = typing.cast(barectf_config._ArrayFieldType, ft)
+
+        if type(ft) is barectf_config.StaticArrayFieldType:
+            if typing.cast(barectf_config.StaticArrayFieldType, ft).length == 0:
+                return False
+
+        elem_ft = ft.element_field_type
+
+        if isinstance(elem_ft, barectf_config._IntegerFieldType):
+            elem_ft = typing.cast(barectf_config._IntegerFieldType, elem_ft)
+            return elem_ft.size in (8, 16, 32, 64) and elem_ft.alignment % 8 == 0 and elem_ft.alignment <= elem_ft.size
+        elif type(elem_ft) is barectf_config.RealFieldType:
+            # C type is `float` or `double`
+            elem_ft = typing.cast(barectf_config.RealFieldType, elem_ft)
+            return elem_ft.alignment == elem_ft.size
+
+        return False
+
+    # Returns the field size (bits) of the operation `op` if it writes
+    # an integer field with the generic template through
+    # bt_bitfield_write_*() at a statically known position, or `None`
+    # otherwise.
+    def _packable_op_size(self, op: _Op) -> Optional[Count]:
+        if type(op) is not _WriteOp or not isinstance(op.ft, barectf_config._IntegerFieldType):
+            return None
+
+        op = typing.cast(_WriteOp, op)
+
+        if op._templates.serialize is not self._cg._serialize_write_int_statements_templ:
+            return None
+
+        if op.at_offset is None or op.offset_in_byte is None:
+            return None
+
+        ft = typing.cast(barectf_config._IntegerFieldType, op.ft)
+        has_fast_path = ft.alignment % 8 == 0 and ft.size in (8, 16, 32, 64)
+        has_fast_path = has_fast_path and type(self._cg._trace_type) is not barectf_config.TraceTypeWithUnknownNativeByteOrder
+
+        if has_fast_path:
+            # aligned standard integer fields have a faster path
+            return None
+
+        return ft.size
+
+    # Returns the operations `ops` in which each run of two or more
+    # consecutive packable "write" operations (see
+    # _packable_op_size()), of which the fields are contiguous and fit
+    # in a 64-bit register with the bits preceding them in their first
+    # byte, is replaced with a single "pack" operation.
+    def _pack_ops(self, ops: List[_Op]) -> List[_Op]:
+        is_le = self._cg._trace_type.trace_byte_order == barectf_config.ByteOrder.LITTLE_ENDIAN
+        new_ops: List[_Op] = []
+        run: List[_WriteOp] = []
+        run_at_offset = Count(0)
+        begin = Count(0)
+        end = Count(0)
+
+        def flush_run() -> None:
+            if len(run) < 2:
+                new_ops.extend(run)
+                run.clear()
+                return
+
+            last_index = (end - 1) // 8
+            preserved_masks: Dict[int, int] = {}
+
+            if begin > 0:
+                # bits before the first field in the first byte
+                preserved_masks[0] = (1 << begin) - 1 if is_le else (0xff << (8 - begin)) & 0xff
+
+            if end % 8 > 0:
+                # bits after the last field in the last byte
+                mask = (0xff << (end % 8)) & 0xff if is_le else (1 << (8 - end % 8)) - 1
+                preserved_masks[last_index] = preserved_masks.get(last_index, 0) | mask
+
+            new_ops.append(_PackOp(run[0].ft, run[0].names, run[0].level,
+                                   _OpTemplates(self._cg._serialize_pack_statements_templ, None),
+                                   list(run), run_at_offset, begin, Count(last_index + 1),
+                                   preserved_masks, self._uses_byte_ptr))
+            run.clear()
+
+        for op in ops:
+            size = self._packable_op_size(op)
+
+            if size is None:
+                flush_run()
+                new_ops.append(op)
+                continue
+
+            op = typing.cast(_WriteOp, op)
+            at_offset = typing.cast(Count, op.at_offset)
+
+            # `begin` and `end` are relative to the first byte of the
+            # run
+            if len(run) > 0 and (at_offset != run_at_offset + end - begin or end + size > 64):
+                flush_run()
+
+            if len(run) == 0:
+                run_at_offset = at_offset
+                begin = typing.cast(Count, op.offset_in_byte)
+                end = begin
+
+            run.append(op)
+            end = Count(end + size)
+
+        flush_run()
+        return new_ops
 
     # Creates and returns an operation for the root structure field type
     # `ft` named `name`.
@@ -171,10 +623,87 @@ class _OpBuilder:
         assert type(ft) is barectf_config.StructureFieldType
         assert len(self._names) == 0
         assert self._level == 0
+
+        # update static size upper bound
+        bound, _, end_state = self._ft_static_info(ft, self._state)
+
+        if bound is None or self._size_upper_bound is None:
+            self._size_upper_bound = None
+        else:
+            self._size_upper_bound = Count(self._size_upper_bound + bound)
+
         ops = self._build_for_ft(ft, name, spec_serialize_write_templates)
         assert len(ops) == 1
         assert type(ops[0]) is _CompoundOp
-        return typing.cast(_CompoundOp, ops[0])
+        op = typing.cast(_CompoundOp, ops[0])
+        assert self._state == end_state
+
+        # update the current offset at the end of the root field
+        advance_op = self._try_create_advance_op(ft)
+
+        if advance_op is not None:
+            op.subops.append(advance_op)
+
+        return op
+
+    # Makes the state of this builder true after the root field types
+    # which both this builder and `other` built operations for,
+    # starting from the same state.
+    #
+    # This is needed when the serialization function selects one of
+    # them at run time.
+    def join(self, other: '_OpBuilder'):
+        assert self._pending == 0 and other._pending == 0
+        assert self._size_pending == 0 and other._size_pending == 0
+        self._state = self._meet_states(self._state, other._state)
+
+        if self._size_upper_bound is None or other._size_upper_bound is None:
+            self._size_upper_bound = None
+        else:
+            self._size_upper_bound = max(self._size_upper_bound, other._size_upper_bound)
+
+    # Creates and returns an operation for the root structure field type
+    # `ft` named `name` which writes the whole field at once from a C
+    # structure having the same memory layout.
+    #
+    # See _CodeGen._payload_struct_is_copyable().
+    def build_for_root_ft_copy(self, ft: barectf_config.StructureFieldType,
+                               name: str) -> _CompoundOp:
+        assert type(ft) is barectf_config.StructureFieldType
+        assert len(self._names) == 0
+        assert self._level == 0
+
+        # update static size upper bound
+        bound, _, _ = self._ft_static_info(ft, self._state)
+        assert bound is not None
+
+        if self._size_upper_bound is not None:
+            self._size_upper_bound = Count(self._size_upper_bound + bound)
+
+        self._names.append(name)
+        subops = self._create_align_ops(ft.alignment, ft)
+        offset_in_byte = self._offset_in_byte
+        size, is_exact, self._state = self._ft_static_info(ft, self._state)
+        assert size is not None and is_exact
+        subops.append(_WriteOp(ft, self._names, self._level,
+                               _OpTemplates(self._cg._serialize_copy_struct_statements_templ,
+                                            None),
+                               offset_in_byte, self._pending, self._uses_byte_ptr))
+        self._pending = Count(self._pending + size)
+        self._size_pending = Count(self._size_pending + size)
+        op = _CompoundOp(ft, self._names, self._level,
+                         _OpTemplates(self._cg._serialize_write_struct_statements_templ,
+                                      self._cg._size_write_struct_statements_templ),
+                         subops, self._uses_byte_ptr)
+        del self._names[-1]
+
+        # update the current offset at the end of the root field
+        advance_op = self._try_create_advance_op(ft)
+
+        if advance_op is not None:
+            op.subops.append(advance_op)
+
+        return op
 
     # Creates and returns the operation(s) for a given field type `ft`
     # named `name`.
@@ -190,12 +719,20 @@ class _OpBuilder:
         #
         # This function considers `spec_serialize_write_templates` to
         # override generic templates.
+        #
+        # This function updates the builder's state.
         def create_write_op(ft: barectf_config._FieldType) -> _WriteOp:
             assert type(ft) is not barectf_config.StructureFieldType
             offset_in_byte = self._offset_in_byte
+            size, is_exact, self._state = self._ft_static_info(ft, self._state)
+            at_offset = None
 
-            if isinstance(ft, barectf_config._BitArrayFieldType) and self._offset_in_byte is not None:
-                self._offset_in_byte = Count((self._offset_in_byte + ft.size) % 8)
+            if size is not None:
+                # statically positioned: defer current offset update
+                assert is_exact
+                at_offset = self._pending
+                self._pending = Count(self._pending + size)
+                self._size_pending = Count(self._size_pending + size)
 
             serialize_write_templ: Optional[barectf_template._Template] = None
 
@@ -207,47 +744,22 @@ class _OpBuilder:
                     serialize_write_templ = self._cg._serialize_write_int_statements_templ
                 elif type(ft) is barectf_config.RealFieldType:
                     serialize_write_templ = self._cg._serialize_write_real_statements_templ
+                elif isinstance(ft, barectf_config._ArrayFieldType):
+                    serialize_write_templ = self._cg._serialize_write_bulk_array_statements_templ
                 else:
                     assert type(ft) is barectf_config.StringFieldType
                     serialize_write_templ = self._cg._serialize_write_string_statements_templ
 
             size_write_templ = None
 
-            if isinstance(ft, barectf_config._BitArrayFieldType):
-                size_write_templ = self._cg._size_write_bit_array_statements_templ
-            elif type(ft) is barectf_config.StringFieldType:
+            if type(ft) is barectf_config.StringFieldType:
                 size_write_templ = self._cg._size_write_string_statements_templ
+            elif type(ft) is barectf_config.DynamicArrayFieldType:
+                size_write_templ = self._cg._size_write_bulk_dynamic_array_statements_templ
 
             return _WriteOp(ft, self._names, self._level,
-                            _OpTemplates(serialize_write_templ, size_write_templ), offset_in_byte)
-
-        # Creates and returns an "align" operation for the field type
-        # `ft` if needed.
-        #
-        # This function updates the builder's state.
-        def try_create_align_op(alignment: Alignment, ft: barectf_config._FieldType) -> Optional[_AlignOp]:
-            def align(v: Count, alignment: Alignment) -> Count:
-                return Count((v + (alignment - 1)) & -alignment)
-
-            if self._offset_in_byte is None and alignment % 8 == 0:
-                self._offset_in_byte = Count(0)
-            else:
-                if self._in_array:
-                    self._offset_in_byte = None
-                elif self._offset_in_byte is not None:
-                    self._offset_in_byte = Count(align(self._offset_in_byte, alignment) % 8)
-
-            if alignment > 1:
-                return _AlignOp(ft, self._names, self._level,
-                                _OpTemplates(self._cg._serialize_align_statements_templ,
-                                             self._cg._size_align_statements_templ),
-                                alignment)
-
-            return None
-
-        # Returns whether or not `ft` is a compound field type.
-        def ft_is_compound(ft: barectf_config._FieldType) -> bool:
-            return isinstance(ft, (barectf_config.StructureFieldType, barectf_config.StaticArrayFieldType))
+                            _OpTemplates(serialize_write_templ, size_write_templ), offset_in_byte,
+                            at_offset, self._uses_byte_ptr)
 
         # push field type's name to the builder's name stack initially
         self._names.append(name)
@@ -255,33 +767,31 @@ class _OpBuilder:
         # operations to return
         ops: List[_Op] = []
 
-        if type(ft) is barectf_config.StringFieldType or self._names == [_RootFtPrefixes.PH, 'uuid']:
-            # strings and UUID array are always byte-aligned
-            op = try_create_align_op(Alignment(8), ft)
+        if type(ft) is barectf_config.StringFieldType:
+            # strings are always byte-aligned
+            ops += self._create_align_ops(Alignment(8), ft)
+
+            # writing a string updates the current offset
+            advance_op = self._try_create_advance_op(ft)
 
-            if op is not None:
-                ops.append(op)
+            if advance_op is not None:
+                ops.append(advance_op)
 
             ops.append(create_write_op(ft))
         else:
-            if ft_is_compound(ft):
-                self._offset_in_byte = None
-
-            init_align_op = try_create_align_op(ft.alignment, ft)
+            init_align_ops = self._create_align_ops(ft.alignment, ft)
             subops: List[_Op] = []
 
             if type(ft) is barectf_config.StructureFieldType:
                 ft = typing.cast(barectf_config.StructureFieldType, ft)
 
-                if init_align_op is not None:
-                    # Append structure field's alignment as a
-                    # suboperation.
-                    #
-                    # This is not strictly needed (could be appended to
-                    # `ops`), but the properties of `_DsOps` and
-                    # `_ErOps` offer a single (structure field type)
-                    # operation.
-                    subops.append(init_align_op)
+                # Append structure field's alignment as a
+                # suboperation.
+                #
+                # This is not strictly needed (could be appended to
+                # `ops`), but the properties of `_DsOps` and `_ErOps`
+                # offer a single (structure field type) operation.
+                subops += init_align_ops
 
                 # append suboperations for each member
                 for member_name, member in ft.members.items():
@@ -292,37 +802,76 @@ class _OpBuilder:
                 ops.append(_CompoundOp(ft, self._names, self._level,
                                        _OpTemplates(self._cg._serialize_write_struct_statements_templ,
                                                     self._cg._size_write_struct_statements_templ),
-                                       subops))
+                                       self._pack_ops(subops), self._uses_byte_ptr))
+            elif self._is_bulk_array_ft(ft):
+                # array field which the C array parameter already
+                # represents as serialized: copy it at once
+                ops += init_align_ops
+
+                if type(ft) is barectf_config.DynamicArrayFieldType:
+                    # the "write" operation updates the current offset
+                    advance_op = self._try_create_advance_op(ft)
+
+                    if advance_op is not None:
+                        ops.append(advance_op)
+
+                ops.append(create_write_op(ft))
             elif isinstance(ft, barectf_config._ArrayFieldType):
                 ft = typing.cast(barectf_config._ArrayFieldType, ft)
-                assert ft.alignment == 1 or init_align_op is not None
+                ops += init_align_ops
+                size, is_exact, end_state = self._ft_static_info(ft, self._state)
+
+                # A static array field of which the size is known
+                # doesn't need a loop in the size computation function.
+                size_is_static = type(ft) is barectf_config.StaticArrayFieldType and is_exact
+
+                # the loop updates the current offset
+                advance_op = self._try_create_advance_op(ft, serialize_only=size_is_static)
 
-                if init_align_op is not None:
-                    ops.append(init_align_op)
+                if advance_op is not None:
+                    ops.append(advance_op)
 
-                # append element's suboperations
+                # append element's suboperations, followed with an
+                # "advance" operation for each element
+                size_pending = self._size_pending
+                self._size_pending = Count(0)
+                self._state = self._array_elem_state(ft.element_field_type, self._state)
                 self._level = Count(self._level + 1)
                 subops += self._build_for_ft(ft.element_field_type,
                                              f'[{_loop_var_name(Count(self._level - 1))}]',
                                              spec_serialize_write_templates)
+                advance_op = self._try_create_advance_op(ft.element_field_type)
+
+                if advance_op is not None:
+                    subops.append(advance_op)
+
                 self._level = Count(self._level - 1)
+                self._state = end_state
+                self._size_pending = size_pending
 
                 # select the right templates
                 if type(ft) is barectf_config.StaticArrayFieldType:
+                    size_templ = None
+
+                    if size_is_static:
+                        assert size is not None
+                        self._size_pending = Count(self._size_pending + size)
+                    else:
+                        size_templ = self._cg._size_write_static_array_statements_templ
+
                     templates = _OpTemplates(self._cg._serialize_write_static_array_statements_templ,
-                                             self._cg._size_write_static_array_statements_templ)
+                                             size_templ)
                 else:
                     assert type(ft) is barectf_config.DynamicArrayFieldType
                     templates = _OpTemplates(self._cg._serialize_write_dynamic_array_statements_templ,
                                              self._cg._size_write_dynamic_array_statements_templ)
 
                 # create array field's compound operation
-                ops.append(_CompoundOp(ft, self._names, self._level, templates, subops))
+                ops.append(_CompoundOp(ft, self._names, self._level, templates, subops,
+                                       self._uses_byte_ptr))
             else:
                 # leaf field: align + write
-                if init_align_op is not None:
-                    ops.append(init_align_op)
-
+                ops += init_align_ops
                 ops.append(create_write_op(ft))
 
         # exiting for this field type: pop its name
@@ -341,9 +890,12 @@ _OptCompoundOp = Optional[_CompoundOp]
 # * Specific context operation.
 # * Payload operation.
 class _ErOps:
-    def __init__(self, spec_ctx_op: _OptCompoundOp, payload_op: _OptCompoundOp):
+    def __init__(self, spec_ctx_op: _OptCompoundOp, payload_op: _OptCompoundOp,
+                 size_upper_bound: Optional[Count], payload_copy_op: _OptCompoundOp = None):
         self._spec_ctx_op = spec_ctx_op
         self._payload_op = payload_op
+        self._size_upper_bound = size_upper_bound
+        self._payload_copy_op = payload_copy_op
 
     @property
     def spec_ctx_op(self) -> _OptCompoundOp:
@@ -353,27 +905,62 @@ class _ErOps:
     def payload_op(self) -> _OptCompoundOp:
         return self._payload_op
 
+    # Payload operation which copies the whole payload field at once
+    # from a payload C structure, or `None` if the memory layout of
+    # such a structure doesn't match the serialized payload field.
+    @property
+    def payload_copy_op(self) -> _OptCompoundOp:
+        return self._payload_copy_op
+
+    # Static upper bound of the size (bits) of a complete event record
+    # (header, common context, specific context, and payload), padding
+    # included, or `None` if there's no such bound.
+    @property
+    def size_upper_bound(self) -> Optional[Count]:
+        return self._size_upper_bound
+
 
 _ErOpsMap = Mapping[barectf_config.EventRecordType, _ErOps]
 
 
+# The constant byte image of a packet header and its size (bits).
+_PktHeaderImage = collections.namedtuple('_PktHeaderImage', ['data', 'size'])
+
+
 # The operations for a data stream.
 #
 # The available operations are:
 #
-# * Packet header operation.
+# * Packet header image (not an operation: the constant fields of the
+#   packet header).
+# * Packet header operation (data stream ID feature only: the
+#   packet header fields which follow the image).
 # * Packet context operation.
 # * Event record header operation.
+# * Extended event record header operation (compact header feature
+#   only).
 # * Event record common context operation.
 # * Event record operations (`_ErOps`).
+#
+# `er_uses_byte_ptr` indicates whether or not the event record
+# operations use a byte pointer (see `_Op.uses_byte_ptr`).
 class _DsOps:
-    def __init__(self, pkt_header_op: _OptCompoundOp, pkt_ctx_op: _CompoundOp,
-                 er_header_op: _OptCompoundOp, er_common_ctx_op: _OptCompoundOp, er_ops: _ErOpsMap):
+    def __init__(self, pkt_header_image: Optional[_PktHeaderImage], pkt_ctx_op: _CompoundOp,
+                 er_header_op: _OptCompoundOp, er_common_ctx_op: _OptCompoundOp, er_ops: _ErOpsMap,
+                 er_uses_byte_ptr: bool = False, er_ext_header_op: _OptCompoundOp = None,
+                 pkt_header_op: _OptCompoundOp = None):
+        self._pkt_header_image = pkt_header_image
         self._pkt_header_op = pkt_header_op
         self._pkt_ctx_op = pkt_ctx_op
         self._er_header_op = er_header_op
+        self._er_ext_header_op = er_ext_header_op
         self._er_common_ctx_op = er_common_ctx_op
         self._er_ops = er_ops
+        self._er_uses_byte_ptr = er_uses_byte_ptr
+
+    @property
+    def pkt_header_image(self) -> Optional[_PktHeaderImage]:
+        return self._pkt_header_image
 
     @property
     def pkt_header_op(self) -> _OptCompoundOp:
@@ -387,6 +974,10 @@ class _DsOps:
     def er_header_op(self) -> _OptCompoundOp:
         return self._er_header_op
 
+    @property
+    def er_ext_header_op(self) -> _OptCompoundOp:
+        return self._er_ext_header_op
+
     @property
     def er_common_ctx_op(self) -> _OptCompoundOp:
         return self._er_common_ctx_op
@@ -395,6 +986,10 @@ class _DsOps:
     def er_ops(self) -> _ErOpsMap:
         return self._er_ops
 
+    @property
+    def er_uses_byte_ptr(self) -> bool:
+        return self._er_uses_byte_ptr
+
 
 # The C variable name prefixes for the six kinds of root field types.
 class _RootFtPrefixes:
@@ -421,6 +1016,16 @@ _ROOT_FT_PREFIX_NAMES = {
 _FtParam = collections.namedtuple('_FtParam', ['ft', 'name'])
 
 
+# A function call of the benchmark harness: static array definitions
+# (`defs`) and an argument string (`args`, each argument preceded with
+# `, `).
+_BenchCall = collections.namedtuple('_BenchCall', ['defs', 'args'])
+
+
+# Length of the dynamic arrays of the benchmark harness.
+_BENCH_DYN_ARRAY_LEN = 4
+
+
 # C type abstract base class.
 class _CType:
     def __init__(self, is_const: bool):
@@ -492,32 +1097,42 @@ class _CodeGen:
             'ft_c_type': self._ft_c_type,
             'open_func_params_str': self._open_func_params_str,
             'trace_func_params_str': self._trace_func_params_str,
+            'trace_func_macro_param_names': self._trace_func_macro_param_names,
+            'has_batch_func': self._has_batch_func,
+            'has_reserve_func': self._has_reserve_func,
+            'fragment_ert': self._fragment_ert,
+            'raw_erts': self._raw_erts,
+            'raw_payload_size': self._raw_payload_size,
             'serialize_er_common_ctx_func_params_str': self._serialize_er_common_ctx_func_params_str,
             'loop_var_name': _loop_var_name,
             'op_src_var_name': self._op_src_var_name,
         }
         self._func_proto_params_templ = self._create_template('func-proto-params.j2')
         self._serialize_align_statements_templ = self._create_template('serialize-align-statements.j2')
+        self._serialize_advance_statements_templ = self._create_template('serialize-advance-statements.j2')
         self._serialize_write_int_statements_templ = self._create_template('serialize-write-int-statements.j2')
         self._serialize_write_real_statements_templ = self._create_template('serialize-write-real-statements.j2')
         self._serialize_write_string_statements_templ = self._create_template('serialize-write-string-statements.j2')
         self._serialize_write_struct_statements_templ = self._create_template('serialize-write-struct-statements.j2')
         self._serialize_write_static_array_statements_templ = self._create_template('serialize-write-static-array-statements.j2')
         self._serialize_write_dynamic_array_statements_templ = self._create_template('serialize-write-dynamic-array-statements.j2')
-        self._serialize_write_magic_statements_templ = self._create_template('serialize-write-magic-statements.j2')
-        self._serialize_write_uuid_statements_templ = self._create_template('serialize-write-uuid-statements.j2')
-        self._serialize_write_dst_id_statements_templ = self._create_template('serialize-write-dst-id-statements.j2')
         self._serialize_write_timestamp_statements_templ = self._create_template('serialize-write-timestamp-statements.j2')
         self._serialize_write_packet_size_statements_templ = self._create_template('serialize-write-packet-size-statements.j2')
         self._serialize_write_seq_num_statements_templ = self._create_template('serialize-write-seq-num-statements.j2')
+        self._serialize_write_ds_id_statements_templ = self._create_template('serialize-write-ds-id-statements.j2')
         self._serialize_write_skip_save_statements_templ = self._create_template('serialize-write-skip-save-statements.j2')
         self._serialize_write_ert_id_statements_templ = self._create_template('serialize-write-ert-id-statements.j2')
+        self._serialize_write_er_header_tag_statements_templ = self._create_template('serialize-write-er-header-tag-statements.j2')
+        self._serialize_pack_statements_templ = self._create_template('serialize-pack-statements.j2')
+        self._serialize_write_bulk_array_statements_templ = self._create_template('serialize-write-bulk-array-statements.j2')
+        self._serialize_copy_struct_statements_templ = self._create_template('serialize-copy-struct-statements.j2')
         self._size_align_statements_templ = self._create_template('size-align-statements.j2')
-        self._size_write_bit_array_statements_templ = self._create_template('size-write-bit-array-statements.j2')
+        self._size_advance_statements_templ = self._create_template('size-advance-statements.j2')
         self._size_write_string_statements_templ = self._create_template('size-write-string-statements.j2')
         self._size_write_struct_statements_templ = self._create_template('size-write-struct-statements.j2')
         self._size_write_static_array_statements_templ = self._create_template('size-write-static-array-statements.j2')
         self._size_write_dynamic_array_statements_templ = self._create_template('size-write-dynamic-array-statements.j2')
+        self._size_write_bulk_dynamic_array_statements_templ = self._create_template('size-write-bulk-dynamic-array-statements.j2')
 
     # Creates and returns a template named `name` which is a file
     # template if `is_file_template` is `True`.
@@ -603,12 +1218,31 @@ class _CodeGen:
     # Each parameter has the prefix `name_prefix` followed with `_`.
     #
     # Members of which the name is in `exclude_set` are excluded.
+    #
+    # If `str_sizes` is `True`, then a `uint32_t` parameter named
+    # `__NAME_size`, NAME being the member name, follows the parameter
+    # of each string member: its value is the size (bytes, including
+    # the null character) of the string. If `only_dyn` is also `True`,
+    # then said parameter replaces the string parameter.
     def _proto_params_str(self, root_ft: Optional[barectf_config.StructureFieldType],
                           name_prefix: str, const_params: bool,
-                          exclude_set: Optional[Set[str]] = None, only_dyn: bool = False) -> str:
+                          exclude_set: Optional[Set[str]] = None, only_dyn: bool = False,
+                          str_sizes: bool = False) -> str:
         if root_ft is None:
             return ''
 
+        params = self._proto_params(root_ft, exclude_set, only_dyn, str_sizes)
+        return self._func_proto_params_templ.render(params=params, prefix=name_prefix,
+                                                    const_params=const_params)
+
+    # Returns the function prototype parameters for the members of the
+    # root structure field type `root_ft`.
+    #
+    # See _proto_params_str() for the meaning of `exclude_set`,
+    # `only_dyn`, and `str_sizes`.
+    def _proto_params(self, root_ft: barectf_config.StructureFieldType,
+                      exclude_set: Optional[Set[str]] = None, only_dyn: bool = False,
+                      str_sizes: bool = False) -> List[_FtParam]:
         if exclude_set is None:
             exclude_set = set()
 
@@ -627,17 +1261,24 @@ class _CodeGen:
             if only_dyn and not is_dyn:
                 continue
 
-            params.append(_FtParam(member.field_type, member_name))
+            is_str = type(member.field_type) is barectf_config.StringFieldType
 
-        return self._func_proto_params_templ.render(params=params, prefix=name_prefix,
-                                                    const_params=const_params)
+            if not (is_str and str_sizes and only_dyn):
+                params.append(_FtParam(member.field_type, member_name))
+
+            if is_str and str_sizes:
+                params.append(_FtParam(barectf_config.UnsignedIntegerFieldType(32),
+                                       f'__{member_name}_size'))
+
+        return params
 
     # Returns the packet opening function prototype parameters for the
     # data stream type `dst`.
     def _open_func_params_str(self, dst: barectf_config.DataStreamType, const_params: bool) -> str:
         parts = []
         parts.append(self._proto_params_str(self._trace_type._pkt_header_ft, _RootFtPrefixes.PH,
-                                            const_params, {'magic', 'stream_id', 'uuid'}))
+                                            const_params,
+                                            {'magic', 'stream_id', 'stream_instance_id', 'uuid'}))
 
         exclude_set = {
             'timestamp_begin',
@@ -653,9 +1294,16 @@ class _CodeGen:
 
     # Returns the tracing function prototype parameters for the data
     # stream and event record types `ds_er_types`.
+    #
+    # If `payload_struct` is `True`, then a single pointer to a payload
+    # C structure named `payload` replaces the payload parameters.
+    #
+    # See _proto_params_str() for `only_dyn` and `str_sizes`.
     def _trace_func_params_str(self, ds_er_types: Tuple[barectf_config.DataStreamType,
                                                         barectf_config.EventRecordType],
-                               const_params: bool, only_dyn: bool = False):
+                               const_params: bool, only_dyn: bool = False,
+                               str_sizes: bool = False, payload_struct: bool = False,
+                               payload: bool = True):
         dst = ds_er_types[0]
         ert = ds_er_types[1]
         parts = []
@@ -663,30 +1311,400 @@ class _CodeGen:
         if dst._er_header_ft is not None:
             parts.append(self._proto_params_str(dst._er_header_ft, _RootFtPrefixes.ERH,
                                                 const_params, {'id', 'timestamp'},
-                                                only_dyn=only_dyn))
+                                                only_dyn=only_dyn, str_sizes=str_sizes))
 
         if dst.event_record_common_context_field_type is not None:
             parts.append(self._proto_params_str(dst.event_record_common_context_field_type,
                                                 _RootFtPrefixes.ERCC, const_params,
-                                                only_dyn=only_dyn))
+                                                only_dyn=only_dyn, str_sizes=str_sizes))
 
         if ert.specific_context_field_type is not None:
             parts.append(self._proto_params_str(ert.specific_context_field_type,
                                                 _RootFtPrefixes.ERSC, const_params,
-                                                only_dyn=only_dyn))
+                                                only_dyn=only_dyn, str_sizes=str_sizes))
 
-        if ert.payload_field_type is not None:
-            parts.append(self._proto_params_str(ert.payload_field_type, _RootFtPrefixes.ERP,
-                                                const_params, only_dyn=only_dyn))
+        if ert.payload_field_type is not None and payload:
+            if payload_struct:
+                c_type = _PointerCType(_ArithCType(f'struct {self._payload_struct_name(dst, ert)}',
+                                                   True), const_params)
+                parts.append(f',\n\t{c_type}{"" if str(c_type).endswith("*") else " "}payload')
+            else:
+                parts.append(self._proto_params_str(ert.payload_field_type, _RootFtPrefixes.ERP,
+                                                    const_params, only_dyn=only_dyn,
+                                                    str_sizes=str_sizes))
 
         return ''.join(parts)
 
+    # Returns the parameter names of the function-like macros which
+    # wrap the tracing function of the event record type
+    # `ds_er_types[1]`, without the leading context parameter.
+    #
+    # Those are the names of the tracing function parameters, or of the
+    # batch tracing function parameters if `batch` is `True`, followed
+    # with the timestamp parameter if `ts` is `True`.
+    def _trace_func_macro_param_names(self, ds_er_types: Tuple[barectf_config.DataStreamType,
+                                                               barectf_config.EventRecordType],
+                                      payload_struct: bool = False,
+                                      batch: bool = False, ts: bool = False) -> List[str]:
+        dst = ds_er_types[0]
+        ert = ds_er_types[1]
+        names = []
+
+        def add_names(root_ft: Optional[barectf_config.StructureFieldType], prefix: str,
+                      exclude_set: Optional[Set[str]] = None):
+            if root_ft is None:
+                return
+
+            for param in self._proto_params(root_ft, exclude_set):
+                names.append(f'{prefix}_{param.name}')
+
+        add_names(dst._er_header_ft, _RootFtPrefixes.ERH, {'id', 'timestamp'})
+        add_names(dst.event_record_common_context_field_type, _RootFtPrefixes.ERCC)
+        add_names(ert.specific_context_field_type, _RootFtPrefixes.ERSC)
+
+        if batch:
+            names += ['count', 'payloads']
+
+            if dst.default_clock_type is not None:
+                names.append('timestamps')
+        elif payload_struct and ert.payload_field_type is not None:
+            names.append('payload')
+        else:
+            add_names(ert.payload_field_type, _RootFtPrefixes.ERP)
+
+        if ts:
+            names.append('timestamp')
+
+        return names
+
+    # Returns a C expression of which the value is a synthesized value
+    # of the field type `ft` for a function call of the benchmark
+    # harness.
+    #
+    # Appends to `defs` the definitions of the static arrays which this
+    # expression needs, naming them after `name`.
+    def _bench_value(self, ft: barectf_config._FieldType, name: str, defs: List[str]) -> str:
+        if isinstance(ft, barectf_config._IntegerFieldType):
+            if isinstance(ft, barectf_config.UnsignedIntegerFieldType):
+                return str(_BENCH_DYN_ARRAY_LEN) if ft._is_len else '1'
+
+            return '-1'
+        elif type(ft) is barectf_config.RealFieldType:
+            c_type = typing.cast(_ArithCType, self._ft_c_type(ft))
+            return '0' if c_type.name == 'uint64_t' else '1.5'
+        elif type(ft) is barectf_config.StringFieldType:
+            return '"barectf"'
+
+        assert isinstance(ft, barectf_config._ArrayFieldType)
+        ft = typing.cast(barectf_config._ArrayFieldType, ft)
+
+        if type(ft) is barectf_config.StaticArrayFieldType:
+            length = typing.cast(barectf_config.StaticArrayFieldType, ft).length
+        else:
+            length = Count(_BENCH_DYN_ARRAY_LEN)
+
+        elem_value = self._bench_value(ft.element_field_type, f'{name}_elem', defs)
+        c_type = self._ft_c_type(ft.element_field_type, True)
+        elem_values = ', '.join([elem_value] * length)
+        defs.append(f'static {c_type}{"" if str(c_type).endswith("*") else " "}{name}[{max(length, 1)}] = {{{elem_values}}};')
+        return name
+
+    # Returns the benchmark harness call of which the arguments are
+    # synthesized values of the members of the root structure field
+    # types `root_fts`.
+    #
+    # Each item of `root_fts` is a root structure field type (possibly
+    # `None`), its name prefix, and the set of the names of its members
+    # to exclude.
+    def _bench_call(self, root_fts: List[Tuple[Optional[barectf_config.StructureFieldType],
+                                               str, Set[str]]]) -> _BenchCall:
+        defs: List[str] = []
+        args = ''
+
+        for root_ft, name_prefix, exclude_set in root_fts:
+            if root_ft is None:
+                continue
+
+            for member_name, member in root_ft.members.items():
+                if member_name in exclude_set:
+                    continue
+
+                args += f', {self._bench_value(member.field_type, f"{name_prefix}_{member_name}", defs)}'
+
+        return _BenchCall(defs, args)
+
+    # Returns the name of the payload C structure of the event record
+    # type `ert` within the data stream type `dst`.
+    def _payload_struct_name(self, dst: barectf_config.DataStreamType,
+                             ert: barectf_config.EventRecordType) -> str:
+        return f'{self._iden_prefix}{dst.name}_{ert.name}_payload'
+
+    # Returns whether or not the memory layout of the payload C
+    # structure of the event record type `ert` matches its serialized
+    # payload field, making it possible to copy the whole field at once.
+    #
+    # This is the case when:
+    #
+    # * The payload structure generation option is enabled.
+    #
+    # * The native byte order is the trace byte order.
+    #
+    # * All the payload members are byte-aligned 8-bit, 16-bit, 32-bit,
+    #   or 64-bit integer fields, or `float`/`double` real fields, each
+    #   one naturally positioned without any padding before it.
+    #
+    # A C compiler doesn't add any padding between such members.
+    def _payload_struct_is_copyable(self, ert: barectf_config.EventRecordType) -> bool:
+        if not self._cfg.options.code_generation_options.payload_structures:
+            return False
+
+        if type(self._trace_type) is barectf_config.TraceTypeWithUnknownNativeByteOrder:
+            return False
+
+        payload_ft = ert.payload_field_type
+        assert payload_ft is not None
+        at = 0
+
+        for member in payload_ft.members.values():
+            ft = member.field_type
+
+            if isinstance(ft, barectf_config._IntegerFieldType):
+                ft = typing.cast(barectf_config._IntegerFieldType, ft)
+
+                if ft.size not in (8, 16, 32, 64) or ft.alignment % 8 != 0:
+                    return False
+            elif type(ft) is barectf_config.RealFieldType:
+                # C type is `float` or `double`
+                ft = typing.cast(barectf_config.RealFieldType, ft)
+
+                if ft.alignment != ft.size:
+                    return False
+            else:
+                return False
+
+            if at % ft.alignment != 0 or at % ft.size != 0:
+                return False
+
+            at += ft.size
+
+        return at > 0
+
+    # Returns whether or not barectf generates a batch tracing function
+    # for the event record type `ert`.
+    #
+    # Such a function serializes many event records of which the
+    # payload C structures can be copied at once, building on the
+    # single-producer event record space reservation.
+    def _has_batch_func(self, ert: barectf_config.EventRecordType) -> bool:
+        cg_opts = self._cfg.options.code_generation_options
+
+        if cg_opts.multi_producer or cg_opts.nested_tracing:
+            return False
+
+        return ert.payload_field_type is not None and self._payload_struct_is_copyable(ert)
+
+    # Returns whether or not barectf generates a reserving function for
+    # the event record type `ert`.
+    #
+    # Such a function returns a pointer to a payload C structure within
+    # the packet buffer. This requires that the memory layout of the
+    # structure, size included, is exactly the one of the serialized
+    # payload field, and that each member is naturally aligned, on top
+    # of the conditions of a batch tracing function.
+    def _has_reserve_func(self, ert: barectf_config.EventRecordType) -> bool:
+        if not self._has_batch_func(ert):
+            return False
+
+        payload_ft = ert.payload_field_type
+        assert payload_ft is not None
+        size = 0
+        max_member_size = 0
+
+        for member in payload_ft.members.values():
+            ft = typing.cast(barectf_config._BitArrayFieldType, member.field_type)
+
+            if ft.alignment != ft.size:
+                return False
+
+            size += ft.size
+            max_member_size = max(max_member_size, ft.size)
+
+        # no trailing padding in the C structure
+        return size % max_member_size == 0
+
+    # Returns whether or not the raw payload tracing function of the
+    # data stream type of the event record type `ert` accepts `ert`.
+    #
+    # Such a function writes the header and common context, and then
+    # copies a payload which the caller already serialized. This
+    # requires that the event record type has no specific context and
+    # a byte-aligned payload, building on the single-producer event
+    # record space reservation.
+    def _has_raw_payload(self, ert: barectf_config.EventRecordType) -> bool:
+        cg_opts = self._cfg.options.code_generation_options
+
+        if cg_opts.multi_producer or cg_opts.nested_tracing:
+            return False
+
+        if ert.specific_context_field_type is not None or ert.payload_field_type is None:
+            return False
+
+        return ert.payload_field_type.alignment >= 8
+
+    # Returns the event record types of the data stream type `dst`
+    # which its raw payload tracing function accepts, sorted by name.
+    def _raw_erts(self, dst: barectf_config.DataStreamType) -> List[barectf_config.EventRecordType]:
+        return [ert for ert in sorted(dst.event_record_types) if self._has_raw_payload(ert)]
+
+    # Returns the size (bits) of the serialized payload field of the
+    # event record type `ert`, starting at an offset aligned like it,
+    # if it's static, or `None`.
+    @staticmethod
+    def _raw_payload_size(ert: barectf_config.EventRecordType) -> Optional[int]:
+        def ft_end_at(ft: barectf_config._FieldType, at: int) -> Optional[int]:
+            at = (at + ft.alignment - 1) // ft.alignment * ft.alignment
+
+            if isinstance(ft, barectf_config._BitArrayFieldType):
+                return at + ft.size
+            elif type(ft) is barectf_config.StaticArrayFieldType:
+                ft = typing.cast(barectf_config.StaticArrayFieldType, ft)
+                end_at: Optional[int] = at
+
+                for _ in range(ft.length):
+                    assert end_at is not None
+                    end_at = ft_end_at(ft.element_field_type, end_at)
+
+                    if end_at is None:
+                        break
+
+                return end_at
+
+            # string or dynamic array
+            return None
+
+        payload_ft = ert.payload_field_type
+        assert payload_ft is not None
+        at: Optional[int] = 0
+
+        for member in payload_ft.members.values():
+            assert at is not None
+            at = ft_end_at(member.field_type, at)
+
+            if at is None:
+                break
+
+        return at
+
+    # Returns the fragment event record type of the data stream type
+    # `dst`, which the fragmentation code generation option adds.
+    @staticmethod
+    def _fragment_ert(dst: barectf_config.DataStreamType) -> barectf_config.EventRecordType:
+        return next(ert for ert in dst.event_record_types
+                    if ert.name == barectf_config.FRAGMENT_EVENT_RECORD_TYPE_NAME)
+
     # Returns the event record common context serialization function
     # prototype parameters for the data stream type `dst`.
     def _serialize_er_common_ctx_func_params_str(self, dst: barectf_config.DataStreamType,
                                                  const_params: bool) -> str:
         return self._proto_params_str(dst.event_record_common_context_field_type,
-                                      _RootFtPrefixes.ERCC, const_params)
+                                      _RootFtPrefixes.ERCC, const_params, str_sizes=True)
+
+    # Returns the constant byte image of the packet header of the data
+    # stream type `dst`, or `None` if the packet header is empty.
+    #
+    # The image contains the magic number, trace type UUID, and data
+    # stream type ID fields, depending on the trace type features: it
+    # stops before the data stream ID field, if any, which isn't
+    # constant.
+    def _pkt_header_image(self, dst: barectf_config.DataStreamType) -> Optional[_PktHeaderImage]:
+        pkt_header_ft = self._trace_type._pkt_header_ft
+
+        if pkt_header_ft is None or len(pkt_header_ft.members) == 0:
+            return None
+
+        is_le = self._trace_type.trace_byte_order == barectf_config.ByteOrder.LITTLE_ENDIAN
+        data = bytearray()
+        at = 0
+
+        def align(alignment: Alignment):
+            nonlocal at
+            at = (at + (alignment - 1)) & -alignment
+
+        # writes the `size`-bit value `val` at the current offset
+        def write(val: int, size: Count):
+            nonlocal at
+
+            for index in range(size):
+                bit_at = at + (index if is_le else size - 1 - index)
+
+                while bit_at // 8 >= len(data):
+                    data.append(0)
+
+                if (val >> index) & 1:
+                    data[bit_at // 8] |= 1 << (bit_at % 8 if is_le else 7 - bit_at % 8)
+
+            at += size
+
+        align(pkt_header_ft.alignment)
+
+        for member_name, member in pkt_header_ft.members.items():
+            if member_name == 'stream_instance_id':
+                break
+
+            ft = member.field_type
+            align(ft.alignment)
+
+            if member_name == 'uuid':
+                assert self._trace_type.uuid is not None
+
+                for byte in self._trace_type.uuid.bytes:
+                    write(byte, Count(8))
+            else:
+                assert isinstance(ft, barectf_config._IntegerFieldType)
+                ft = typing.cast(barectf_config._IntegerFieldType, ft)
+                val = 0xc1fc1fc1 if member_name == 'magic' else typing.cast(int, dst.id)
+                write(val & ((1 << ft.size) - 1), ft.size)
+
+        if at == 0:
+            return None
+
+        while len(data) * 8 < at:
+            data.append(0)
+
+        return _PktHeaderImage(bytes(data), Count(at))
+
+    # Returns whether or not the event record serialization functions of
+    # the data stream type `dst` use a byte pointer.
+    #
+    # They do when the byte pointer serialization option is enabled and
+    # all the event record fields are byte-aligned and have a size which
+    # is a multiple of eight bits: the current offset then always is a
+    # multiple of eight within an event record.
+    def _dst_er_uses_byte_ptr(self, dst: barectf_config.DataStreamType) -> bool:
+        if not self._cfg.options.code_generation_options.byte_pointer_serialization:
+            return False
+
+        def ft_is_byte_aligned(ft: barectf_config._FieldType) -> bool:
+            if isinstance(ft, barectf_config._BitArrayFieldType):
+                ft = typing.cast(barectf_config._BitArrayFieldType, ft)
+                return ft.alignment % 8 == 0 and ft.size % 8 == 0
+            elif type(ft) is barectf_config.StructureFieldType:
+                ft = typing.cast(barectf_config.StructureFieldType, ft)
+                return all([ft_is_byte_aligned(member.field_type) for member in ft.members.values()])
+            elif isinstance(ft, barectf_config._ArrayFieldType):
+                ft = typing.cast(barectf_config._ArrayFieldType, ft)
+                return ft_is_byte_aligned(ft.element_field_type)
+
+            # strings are always byte-aligned
+            assert type(ft) is barectf_config.StringFieldType
+            return True
+
+        root_fts = [dst._er_header_ft, dst.event_record_common_context_field_type]
+
+        for ert in dst.event_record_types:
+            root_fts += [ert.specific_context_field_type, ert.payload_field_type]
+
+        return all([ft_is_byte_aligned(ft) for ft in root_fts if ft is not None])
 
     # Generates the bitfield header file contents.
     def gen_bitfield_header(self) -> str:
@@ -704,20 +1722,21 @@ class _CodeGen:
             ds_ops = {}
 
             for dst in self._trace_type.data_stream_types:
+                # packet header image: the packet header operation, if
+                # any, or the packet context follows it
+                pkt_header_image = self._pkt_header_image(dst)
+                builder = _OpBuilder(self, Count(0) if pkt_header_image is None else pkt_header_image.size)
+
+                # packet header operation (data stream ID field)
                 pkt_header_op = None
-                builder = _OpBuilder(self)
-                pkt_header_ft = self._trace_type._pkt_header_ft
+                ds_id_ft = typing.cast(Optional[barectf_config.UnsignedIntegerFieldType],
+                                       self._trace_type.features.data_stream_id_field_type)
 
-                # packet header operations
-                if pkt_header_ft is not None:
-                    spec_serialize_write_templates = {
-                        'magic': self._serialize_write_magic_statements_templ,
-                        'uuid': self._serialize_write_uuid_statements_templ,
-                        'stream_id': self._serialize_write_dst_id_statements_templ,
-                    }
-                    pkt_header_op = builder.build_for_root_ft(pkt_header_ft,
-                                                                  _RootFtPrefixes.PH,
-                                                                  spec_serialize_write_templates)
+                if ds_id_ft is not None:
+                    members = {'stream_instance_id': barectf_config.StructureFieldTypeMember(ds_id_ft)}
+                    pkt_header_op = builder.build_for_root_ft(barectf_config.StructureFieldType(members=members),
+                                                              _RootFtPrefixes.PH,
+                                                              {'stream_instance_id': self._serialize_write_ds_id_statements_templ})
 
                 # packet context operation
                 spec_serialize_write_templates = {
@@ -732,17 +1751,32 @@ class _CodeGen:
                                                        spec_serialize_write_templates)
 
                 # event record header operation
-                builder = _OpBuilder(self)
+                er_uses_byte_ptr = self._dst_er_uses_byte_ptr(dst)
+                builder = _OpBuilder(self, uses_byte_ptr=er_uses_byte_ptr)
                 er_header_op = None
+                er_ext_header_op = None
 
                 if dst._er_header_ft is not None:
                     spec_serialize_write_templates = {
                         'timestamp': self._serialize_write_timestamp_statements_templ,
                         'id': self._serialize_write_ert_id_statements_templ,
+                        'tag': self._serialize_write_er_header_tag_statements_templ,
                     }
+
+                    if dst._er_ext_header_ft is not None:
+                        # compact header feature: the serialization
+                        # function selects the header at run time
+                        ext_builder = copy.copy(builder)
+                        er_ext_header_op = ext_builder.build_for_root_ft(dst._er_ext_header_ft,
+                                                                         _RootFtPrefixes.ERH,
+                                                                         spec_serialize_write_templates)
+
                     er_header_op = builder.build_for_root_ft(dst._er_header_ft, _RootFtPrefixes.ERH,
                                                              spec_serialize_write_templates)
 
+                    if dst._er_ext_header_ft is not None:
+                        builder.join(ext_builder)
+
                 # event record common context operation
                 er_common_ctx_op = None
 
@@ -763,17 +1797,23 @@ class _CodeGen:
                         spec_ctx_op = ev_builder.build_for_root_ft(ert.specific_context_field_type,
                                                                    _RootFtPrefixes.ERSC)
 
-                    # payload operation
+                    # payload operations
                     payload_op = None
+                    payload_copy_op = None
 
                     if ert.payload_field_type is not None:
+                        if self._payload_struct_is_copyable(ert):
+                            payload_copy_op = copy.copy(ev_builder).build_for_root_ft_copy(ert.payload_field_type,
+                                                                                           _RootFtPrefixes.ERP)
+
                         payload_op = ev_builder.build_for_root_ft(ert.payload_field_type,
                                                                   _RootFtPrefixes.ERP)
 
-                    er_ops[ert] = _ErOps(spec_ctx_op, payload_op)
+                    er_ops[ert] = _ErOps(spec_ctx_op, payload_op, ev_builder.size_upper_bound,
+                                         payload_copy_op)
 
-                ds_ops[dst] = _DsOps(pkt_header_op, pkt_ctx_op, er_header_op, er_common_ctx_op,
-                                     er_ops)
+                ds_ops[dst] = _DsOps(pkt_header_image, pkt_ctx_op, er_header_op, er_common_ctx_op,
+                                     er_ops, er_uses_byte_ptr, er_ext_header_op, pkt_header_op)
 
             return ds_ops
 
@@ -797,3 +1837,37 @@ class _CodeGen:
                                                                  root_ft_prefix_names=_ROOT_FT_PREFIX_NAMES,
                                                                  ds_ops=ds_ops,
                                                                  ds_op_pkt_ctx_op=ds_op_pkt_ctx_op)
+
+    # Generates the benchmark harness source code file contents.
+    def gen_benchmark_harness(self, header_file_name: str) -> str:
+        open_calls = {}
+        trace_calls = {}
+
+        for dst in self._trace_type.data_stream_types:
+            # same parameters as _open_func_params_str()
+            pkt_ctx_exclude_set = {
+                'timestamp_begin',
+                'timestamp_end',
+                'packet_size',
+                'content_size',
+                'events_discarded',
+                'packet_seq_num',
+            }
+            open_calls[dst] = self._bench_call([
+                (self._trace_type._pkt_header_ft, _RootFtPrefixes.PH,
+                 {'magic', 'stream_id', 'stream_instance_id', 'uuid'}),
+                (dst._pkt_ctx_ft, _RootFtPrefixes.PC, pkt_ctx_exclude_set),
+            ])
+
+            # same parameters as _trace_func_params_str()
+            for ert in dst.event_record_types:
+                trace_calls[ert] = self._bench_call([
+                    (dst._er_header_ft, _RootFtPrefixes.ERH, {'id', 'timestamp'}),
+                    (dst.event_record_common_context_field_type, _RootFtPrefixes.ERCC, set()),
+                    (ert.specific_context_field_type, _RootFtPrefixes.ERSC, set()),
+                    (ert.payload_field_type, _RootFtPrefixes.ERP, set()),
+                ])
+
+        return self._create_file_template('benchmark.c.j2').render(header_file_name=header_file_name,
+                                                                   open_calls=open_calls,
+                                                                   trace_calls=trace_calls)
@@ -160,13 +160,15 @@ def _print_gen_cmd_usage():
     print('''Usage: barectf generate [--code-dir=DIR] [--headers-dir=DIR]
                         [--metadata-dir=DIR] [--prefix=PREFIX]
                         [--include-dir=DIR]... [--ignore-include-not-found]
-                        CONFIG-FILE-PATH
+                        [--benchmark-harness] CONFIG-FILE-PATH
        barectf generate --help
 
 Generate the C source and CTF metadata stream files of a tracer from the
 configuration file CONFIG-FILE-PATH.
 
 Options:
+  --benchmark-harness           Also write the C source file of a benchmark
+                                harness of the tracer
   -c DIR, --code-dir=DIR        Write C source files to DIR instead of the CWD
   -H DIR, --headers-dir=DIR     Write C header files to DIR instead of the CWD
   -h, --help                    Show this help and quit
@@ -192,6 +194,7 @@ def _gen_cmd_cfg_from_args(orig_args: barectf_argpar.OrigArgs) -> '_GenCmd':
         barectf_argpar.OptDescr('p', 'prefix', True),
         barectf_argpar.OptDescr(long_name='dump-config'),
         barectf_argpar.OptDescr(long_name='ignore-include-not-found'),
+        barectf_argpar.OptDescr(long_name='benchmark-harness'),
     ]
     res = barectf_argpar.parse(orig_args, opt_descrs)
     assert len(res.ingested_orig_args) == len(orig_args)
@@ -216,10 +219,12 @@ def _gen_cmd_cfg_from_args(orig_args: barectf_argpar.OrigArgs) -> '_GenCmd':
     # other options
     dump_config = _opt_item_val(res.items, 'dump-config', False)
     v2_prefix = _opt_item_val(res.items, 'prefix')
+    benchmark_harness = _opt_item_val(res.items, 'benchmark-harness', False)
 
     return _GenCmd(_GenCmdCfg(cfg_cmd_cfg.cfg_file_path, c_source_dir, c_header_dir,
                               metadata_stream_dir, cfg_cmd_cfg.inclusion_dirs,
-                              cfg_cmd_cfg.ignore_inclusion_file_not_found, dump_config, v2_prefix))
+                              cfg_cmd_cfg.ignore_inclusion_file_not_found, dump_config, v2_prefix,
+                              benchmark_harness))
 
 
 def _show_effective_cfg_cmd_usage():
@@ -447,13 +452,15 @@ class _Cmd:
 class _GenCmdCfg(_CfgCmdCfg):
     def __init__(self, cfg_file_path: str, c_source_dir: str, c_header_dir: str,
                  metadata_stream_dir: str, inclusion_dirs: List[str],
-                 ignore_inclusion_file_not_found: bool, dump_config: bool, v2_prefix: str):
+                 ignore_inclusion_file_not_found: bool, dump_config: bool, v2_prefix: str,
+                 benchmark_harness: bool):
         super().__init__(cfg_file_path, inclusion_dirs, ignore_inclusion_file_not_found)
         self._c_source_dir = c_source_dir
         self._c_header_dir = c_header_dir
         self._metadata_stream_dir = metadata_stream_dir
         self._dump_config = dump_config
         self._v2_prefix = v2_prefix
+        self._benchmark_harness = benchmark_harness
 
     @property
     def c_source_dir(self) -> str:
@@ -475,6 +482,10 @@ class _GenCmdCfg(_CfgCmdCfg):
     def v2_prefix(self) -> str:
         return self._v2_prefix
 
+    @property
+    def benchmark_harness(self) -> bool:
+        return self._benchmark_harness
+
 
 # Source and metadata stream file generating command.
 class _GenCmd(_Cmd):
@@ -533,6 +544,10 @@ class _GenCmd(_Cmd):
 
             # generate and write C source files
             write_files(self.cfg.c_source_dir, code_gen.generate_c_sources())
+
+            if self.cfg.benchmark_harness:
+                # generate and write benchmark harness C source file
+                write_file(self.cfg.c_source_dir, code_gen.generate_benchmark_harness())
         except Exception as exc:
             # We know `config` is valid, therefore the code generator cannot
             # fail for a reason known to barectf.
@@ -50,7 +50,8 @@ class _GeneratedFile:
 # Build a code generator with a barectf configuration.
 #
 # A code generator can generate the TSDL `metadata` file and C source
-# and header files.
+# and header files, as well as the C source file of a benchmark harness
+# of the tracer.
 class CodeGenerator:
     def __init__(self, configuration: barectf_config.Configuration):
         self._config = configuration
@@ -59,6 +60,7 @@ class CodeGenerator:
         self._c_headers: Optional[List[_GeneratedFile]] = None
         self._c_sources: Optional[List[_GeneratedFile]] = None
         self._metadata_stream: Optional[_GeneratedFile] = None
+        self._benchmark_harness: Optional[_GeneratedFile] = None
 
     @property
     def _barectf_header_name(self) -> str:
@@ -87,6 +89,13 @@ class CodeGenerator:
 
         return self._c_sources
 
+    def generate_benchmark_harness(self) -> _GeneratedFile:
+        if self._benchmark_harness is None:
+            self._benchmark_harness = _GeneratedFile(f'{self._file_name_prefix}-benchmark.c',
+                                                     self._c_code_gen.gen_benchmark_harness(self._barectf_header_name))
+
+        return self._benchmark_harness
+
     def generate_metadata_stream(self) -> _GeneratedFile:
         if self._metadata_stream is None:
             self._metadata_stream = _GeneratedFile('metadata',
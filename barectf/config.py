@@ -22,13 +22,14 @@
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import barectf.version as barectf_version
-from typing import Optional, Any, FrozenSet, Mapping, Iterator, Set, Union, Callable
+from typing import Optional, Any, FrozenSet, Mapping, Iterator, Iterable, Set, Union, Callable
 import typing
 from barectf.typing import Count, Alignment, _OptStr, Id
 import collections.abc
 import collections
 import datetime
 import enum
+import math
 import uuid as uuidp
 
 
@@ -338,6 +339,10 @@ _OptFt = Optional[_FieldType]
 _OptStructFt = Optional[StructureFieldType]
 LogLevel = typing.NewType('LogLevel', int)
 
+# Name of the event record type which the fragmentation code generation
+# option adds to each data stream type.
+FRAGMENT_EVENT_RECORD_TYPE_NAME = 'barectf_fragment'
+
 
 class EventRecordType(_UniqueByName):
     def __init__(self, name: str, log_level: Optional[LogLevel] = None,
@@ -369,6 +374,33 @@ class EventRecordType(_UniqueByName):
         return self._payload_field_type
 
 
+# Creates the event record type which the fragmentation code generation
+# option requires in each data stream type.
+#
+# An event record of this type contains a fragment of a blob: a reader
+# reassembles the blob having a given ID by concatenating the `data`
+# fields of its fragments in `offset` order, up to the fragment having
+# the `LAST` status.
+def create_fragment_event_record_type() -> EventRecordType:
+    u32_ft = UnsignedIntegerFieldType(Count(32), Alignment(8))
+    status_mappings = {
+        'MORE': EnumerationFieldTypeMapping({EnumerationFieldTypeMappingRange(0, 0)}),
+        'LAST': EnumerationFieldTypeMapping({EnumerationFieldTypeMappingRange(1, 1)}),
+    }
+    status_ft = UnsignedEnumerationFieldType(Count(8), Alignment(8), mappings=status_mappings)
+    data_len_ft = UnsignedIntegerFieldType(Count(32), Alignment(8))
+    byte_ft = UnsignedIntegerFieldType(Count(8), Alignment(8), DisplayBase.HEXADECIMAL)
+    data_ft = DynamicArrayFieldType(data_len_ft, byte_ft)
+    members = collections.OrderedDict()
+    members['blob_id'] = StructureFieldTypeMember(u32_ft)
+    members['offset'] = StructureFieldTypeMember(u32_ft)
+    members['status'] = StructureFieldTypeMember(status_ft)
+    members['__data_len'] = StructureFieldTypeMember(data_len_ft)
+    members['data'] = StructureFieldTypeMember(data_ft)
+    return EventRecordType(FRAGMENT_EVENT_RECORD_TYPE_NAME,
+                           payload_field_type=StructureFieldType(members=members))
+
+
 class ClockTypeOffset:
     def __init__(self, seconds: int = 0, cycles: Count = Count(0)):
         self._seconds = seconds
@@ -432,10 +464,35 @@ class ClockType(_UniqueByName):
 
 
 DEFAULT_FIELD_TYPE = 'default'
+AUTO_FIELD_TYPE = 'auto'
 _DefaultableUIntFt = Union[str, UnsignedIntegerFieldType]
 _OptDefaultableUIntFt = Optional[_DefaultableUIntFt]
 _OptUIntFt = Optional[UnsignedIntegerFieldType]
 
+# A feature field type: `AUTO_FIELD_TYPE` until the data stream type or
+# trace type which contains the feature object resolves it (see
+# DataStreamType._set_auto_feature_fts() and
+# _TraceType._set_auto_feature_fts()).
+_OptFeatureUIntFt = Optional[Union[str, UnsignedIntegerFieldType]]
+
+
+# Returns the feature field type for the user field type `user_ft`.
+def _feature_uint_ft(user_ft: _OptDefaultableUIntFt) -> _OptFeatureUIntFt:
+    if user_ft == DEFAULT_FIELD_TYPE:
+        return UnsignedIntegerFieldType(64)
+
+    return user_ft
+
+
+# Returns an unsigned integer field type replacing `ft` if it's
+# `AUTO_FIELD_TYPE`, the size of which is the minimal one to hold
+# `max_val`, or `ft` itself otherwise.
+def _sized_auto_feature_uint_ft(ft: _OptFeatureUIntFt, max_val: int) -> _OptUIntFt:
+    if ft == AUTO_FIELD_TYPE:
+        return UnsignedIntegerFieldType(Count(min(max(max_val.bit_length(), 1), 64)))
+
+    return typing.cast(_OptUIntFt, ft)
+
 
 class DataStreamTypePacketFeatures:
     def __init__(self, total_size_field_type: _DefaultableUIntFt = DEFAULT_FIELD_TYPE,
@@ -443,69 +500,76 @@ class DataStreamTypePacketFeatures:
                  beginning_timestamp_field_type: _OptDefaultableUIntFt = None,
                  end_timestamp_field_type: _OptDefaultableUIntFt = None,
                  discarded_event_records_snapshot_counter_field_type: _OptDefaultableUIntFt = DEFAULT_FIELD_TYPE,
-                 sequence_number_field_type: _OptDefaultableUIntFt = None):
-        def get_ft(user_ft: _OptDefaultableUIntFt) -> _OptUIntFt:
-            if user_ft == DEFAULT_FIELD_TYPE:
-                return UnsignedIntegerFieldType(64)
-
-            return typing.cast(_OptUIntFt, user_ft)
-
-        self._total_size_field_type = get_ft(total_size_field_type)
-        self._content_size_field_type = get_ft(content_size_field_type)
-        self._beginning_timestamp_field_type = get_ft(beginning_timestamp_field_type)
-        self._end_timestamp_field_type = get_ft(end_timestamp_field_type)
-        self._discarded_event_records_snapshot_counter_field_type = get_ft(discarded_event_records_snapshot_counter_field_type)
-        self._sequence_number_field_type = get_ft(sequence_number_field_type)
-
-    @property
-    def sequence_number_field_type(self) -> _OptUIntFt:
+                 sequence_number_field_type: _OptDefaultableUIntFt = None,
+                 maximum_total_size: Optional[Count] = None):
+        self._total_size_field_type = _feature_uint_ft(total_size_field_type)
+        self._content_size_field_type = _feature_uint_ft(content_size_field_type)
+        self._beginning_timestamp_field_type = _feature_uint_ft(beginning_timestamp_field_type)
+        self._end_timestamp_field_type = _feature_uint_ft(end_timestamp_field_type)
+        self._discarded_event_records_snapshot_counter_field_type = _feature_uint_ft(discarded_event_records_snapshot_counter_field_type)
+        self._sequence_number_field_type = _feature_uint_ft(sequence_number_field_type)
+        self._maximum_total_size = maximum_total_size
+
+    @property
+    def sequence_number_field_type(self) -> _OptFeatureUIntFt:
         return self._sequence_number_field_type
 
     @property
-    def total_size_field_type(self) -> _OptUIntFt:
+    def total_size_field_type(self) -> _OptFeatureUIntFt:
         return self._total_size_field_type
 
     @property
-    def content_size_field_type(self) -> _OptUIntFt:
+    def content_size_field_type(self) -> _OptFeatureUIntFt:
         return self._content_size_field_type
 
+    # Maximum total size of a packet (bytes), if known.
     @property
-    def beginning_timestamp_field_type(self) -> _OptUIntFt:
+    def maximum_total_size(self) -> Optional[Count]:
+        return self._maximum_total_size
+
+    @property
+    def beginning_timestamp_field_type(self) -> _OptFeatureUIntFt:
         return self._beginning_timestamp_field_type
 
     @property
-    def end_timestamp_field_type(self) -> _OptUIntFt:
+    def end_timestamp_field_type(self) -> _OptFeatureUIntFt:
         return self._end_timestamp_field_type
 
     @property
-    def discarded_event_records_snapshot_counter_field_type(self) -> _OptUIntFt:
+    def discarded_event_records_snapshot_counter_field_type(self) -> _OptFeatureUIntFt:
         return self._discarded_event_records_snapshot_counter_field_type
 
 
 class DataStreamTypeEventRecordFeatures:
     def __init__(self, type_id_field_type: _OptDefaultableUIntFt = DEFAULT_FIELD_TYPE,
-                 timestamp_field_type: _OptDefaultableUIntFt = None):
-        def get_ft(user_ft: _OptDefaultableUIntFt) -> _OptUIntFt:
-            if user_ft == DEFAULT_FIELD_TYPE:
-                return UnsignedIntegerFieldType(64)
-
-            return typing.cast(_OptUIntFt, user_ft)
-
-        self._type_id_field_type = get_ft(type_id_field_type)
-        self._timestamp_field_type = get_ft(timestamp_field_type)
+                 timestamp_field_type: _OptDefaultableUIntFt = None,
+                 compact_header: bool = False):
+        self._type_id_field_type = _feature_uint_ft(type_id_field_type)
+        self._timestamp_field_type = _feature_uint_ft(timestamp_field_type)
+        self._compact_header = compact_header
 
     @property
-    def type_id_field_type(self) -> _OptUIntFt:
+    def type_id_field_type(self) -> _OptFeatureUIntFt:
         return self._type_id_field_type
 
     @property
-    def timestamp_field_type(self) -> _OptUIntFt:
+    def timestamp_field_type(self) -> _OptFeatureUIntFt:
         return self._timestamp_field_type
 
+    # If this is `True`, then the type ID and timestamp field types are
+    # the ones of the extended header. See
+    # DataStreamType._set_er_header_ft().
+    @property
+    def compact_header(self) -> bool:
+        return self._compact_header
+
 
 class DataStreamTypeFeatures:
     def __init__(self, packet_features: Optional[DataStreamTypePacketFeatures] = None,
-                 event_record_features: Optional[DataStreamTypeEventRecordFeatures] = None):
+                 event_record_features: Optional[DataStreamTypeEventRecordFeatures] = None,
+                 maximum_timestamp_delta: Optional[float] = None):
+        self._maximum_timestamp_delta = maximum_timestamp_delta
+
         if packet_features is None:
             self._packet_features = DataStreamTypePacketFeatures()
         else:
@@ -524,9 +588,15 @@ class DataStreamTypeFeatures:
     def event_record_features(self) -> DataStreamTypeEventRecordFeatures:
         return self._event_record_features
 
+    # Maximum duration (seconds) between two consecutive timestamps of
+    # a data stream, if known.
+    @property
+    def maximum_timestamp_delta(self) -> Optional[float]:
+        return self._maximum_timestamp_delta
+
 
 class DataStreamType(_UniqueByName):
-    def __init__(self, name: str, event_record_types: Set[EventRecordType],
+    def __init__(self, name: str, event_record_types: Iterable[EventRecordType],
                  default_clock_type: Optional[ClockType] = None,
                  features: Optional[DataStreamTypeFeatures] = None,
                  packet_context_field_type_extra_members: Optional[_StructFtMembers] = None,
@@ -535,14 +605,30 @@ class DataStreamType(_UniqueByName):
         self._name = name
         self._default_clock_type = default_clock_type
         self._event_record_common_context_field_type = event_record_common_context_field_type
-        self._event_record_types = frozenset(event_record_types)
+        ordered_erts = list(event_record_types)
+        self._event_record_types = frozenset(ordered_erts)
+        self._set_features(features)
 
-        # assign unique IDs
-        for index, ert in enumerate(sorted(self._event_record_types, key=lambda evt: evt.name)):
+        # assign unique IDs, the fragment event record type, if any,
+        # having the last one so that the fragmentation code generation
+        # option doesn't change the IDs of the other ones
+        #
+        # Only the IDs 0 to 30 fit a compact event record header: with
+        # the compact header feature, the IDs follow the order of
+        # `event_record_types` so that the first event record types get
+        # compact headers. Otherwise, they follow the names.
+        if self._features.event_record_features.compact_header:
+            def ert_sort_key(ert: EventRecordType):
+                return (ert.name == FRAGMENT_EVENT_RECORD_TYPE_NAME, ordered_erts.index(ert))
+        else:
+            def ert_sort_key(ert: EventRecordType):
+                return (ert.name == FRAGMENT_EVENT_RECORD_TYPE_NAME, ert.name)
+
+        for index, ert in enumerate(sorted(self._event_record_types, key=ert_sort_key)):
             assert ert._id is None
             ert._id = Id(index)
 
-        self._set_features(features)
+        self._set_auto_feature_fts()
         self._packet_context_field_type_extra_members = StructureFieldTypeMembers({})
 
         if packet_context_field_type_extra_members is not None:
@@ -571,6 +657,74 @@ class DataStreamType(_UniqueByName):
                                                                              end_timestamp_field_type=pkt_end_ts_ft),
                                                 DataStreamTypeEventRecordFeatures(timestamp_field_type=er_ts_ft))
 
+    # Replaces the features with a copy of which the automatic feature
+    # field types are unsigned integer field types having the minimal
+    # sizes, considering:
+    #
+    # Total and content sizes:
+    #     The maximum total size of a packet, if known, or the 32-bit
+    #     packet size of the generated tracer.
+    #
+    # Packet beginning and end timestamps:
+    #     64 bits: a packet can be open for any duration.
+    #
+    # Event record timestamp:
+    #     The number of default clock cycles within the maximum
+    #     duration between two consecutive timestamps, if known (a CTF
+    #     consumer handles a single wrap of a timestamp field).
+    #
+    #     A compact event record header requires an extended timestamp
+    #     field type of at least 27 bits.
+    #
+    # Discarded event record counter snapshot and sequence number:
+    #     The 32-bit counters of the generated tracer.
+    #
+    # Event record type ID:
+    #     The number of event record types.
+    #
+    # The copy belongs to this data stream type: many data stream types
+    # can share the same user feature objects.
+    def _set_auto_feature_fts(self):
+        pkt_features = self._features.packet_features
+        er_features = self._features.event_record_features
+        max_u32 = 2 ** 32 - 1
+        max_size = max_u32
+
+        if pkt_features.maximum_total_size is not None:
+            max_size = pkt_features.maximum_total_size * 8
+
+        max_u64 = 2 ** 64 - 1
+        max_ts = max_u64
+        max_ts_delta = self._features.maximum_timestamp_delta
+
+        if self._default_clock_type is not None and max_ts_delta is not None:
+            max_ts = math.ceil(self._default_clock_type.frequency * max_ts_delta)
+
+        if er_features.compact_header:
+            max_er_ts = max(max_ts, 2 ** 27 - 1)
+        else:
+            max_er_ts = max_ts
+
+        sized = _sized_auto_feature_uint_ft
+        total_size_ft = sized(pkt_features.total_size_field_type, max_size)
+        content_size_ft = sized(pkt_features.content_size_field_type, max_size)
+        beginning_ts_ft = sized(pkt_features.beginning_timestamp_field_type, max_u64)
+        end_ts_ft = sized(pkt_features.end_timestamp_field_type, max_u64)
+        disc_er_counter_snap_ft = sized(pkt_features.discarded_event_records_snapshot_counter_field_type,
+                                        max_u32)
+        seq_num_ft = sized(pkt_features.sequence_number_field_type, max_u32)
+        type_id_ft = sized(er_features.type_id_field_type, len(self._event_record_types) - 1)
+        er_ts_ft = sized(er_features.timestamp_field_type, max_er_ts)
+
+        # The resolved field types are never `DEFAULT_FIELD_TYPE`: the
+        # feature object constructors keep them as is.
+        pkt_features = DataStreamTypePacketFeatures(typing.cast(UnsignedIntegerFieldType, total_size_ft),
+                                                    typing.cast(UnsignedIntegerFieldType, content_size_ft),
+                                                    beginning_ts_ft, end_ts_ft, disc_er_counter_snap_ft,
+                                                    seq_num_ft, pkt_features.maximum_total_size)
+        er_features = DataStreamTypeEventRecordFeatures(type_id_ft, er_ts_ft, er_features.compact_header)
+        self._features = DataStreamTypeFeatures(pkt_features, er_features, max_ts_delta)
+
     def _set_ft_mapped_clk_type_name(self, ft: Optional[UnsignedIntegerFieldType]):
         if ft is None:
             return
@@ -618,7 +772,51 @@ class DataStreamType(_UniqueByName):
 
         self._pkt_ctx_ft = StructureFieldType(8, members)
 
+    # Sets the event record header field type.
+    #
+    # With the compact header feature, an event record header is either:
+    #
+    # Compact:
+    #     5-bit event record type ID (0 to 30) and 27-bit timestamp.
+    #
+    # Extended:
+    #     5-bit tag (31), followed with the event record type ID and
+    #     timestamp fields of the event record features.
+    #
+    # In this case, `self._er_header_ft` is the compact header field
+    # type and `self._er_ext_header_ft` is the extended header field
+    # type. The metadata stream describes both with a variant.
     def _set_er_header_ft(self):
+        er_features = self._features.event_record_features
+        self._er_ext_header_ft = None
+
+        if er_features.compact_header:
+            id_ft = er_features.type_id_field_type
+            ts_ft = er_features.timestamp_field_type
+            assert id_ft is not None
+            assert ts_ft is not None
+            tag_ft = UnsignedEnumerationFieldType(5, Alignment(1), mappings={
+                'compact': EnumerationFieldTypeMapping({EnumerationFieldTypeMappingRange(0, 30)}),
+                'extended': EnumerationFieldTypeMapping({EnumerationFieldTypeMappingRange(31, 31)}),
+            })
+            compact_ts_ft = UnsignedIntegerFieldType(27, Alignment(1))
+            self._set_ft_mapped_clk_type_name(compact_ts_ft)
+            self._set_ft_mapped_clk_type_name(ts_ft)
+            self._er_header_ft = StructureFieldType(8, collections.OrderedDict([
+                ('id', StructureFieldTypeMember(tag_ft)),
+                ('timestamp', StructureFieldTypeMember(compact_ts_ft)),
+            ]))
+
+            # The extended structure field type within the variant
+            # field type is aligned like its most aligned member.
+            ext_id_ft = UnsignedIntegerFieldType(id_ft.size, max(id_ft.alignment, ts_ft.alignment))
+            self._er_ext_header_ft = StructureFieldType(8, collections.OrderedDict([
+                ('tag', StructureFieldTypeMember(tag_ft)),
+                ('id', StructureFieldTypeMember(ext_id_ft)),
+                ('timestamp', StructureFieldTypeMember(ts_ft)),
+            ]))
+            return
+
         members = collections.OrderedDict()
 
         if self._features.event_record_features.type_id_field_type is not None:
@@ -666,7 +864,8 @@ _OptUuidFt = Optional[Union[str, StaticArrayFieldType]]
 class TraceTypeFeatures:
     def __init__(self, magic_field_type: _OptDefaultableUIntFt = DEFAULT_FIELD_TYPE,
                  uuid_field_type: _OptUuidFt = None,
-                 data_stream_type_id_field_type: _OptDefaultableUIntFt = DEFAULT_FIELD_TYPE):
+                 data_stream_type_id_field_type: _OptDefaultableUIntFt = DEFAULT_FIELD_TYPE,
+                 data_stream_id_field_type: _OptDefaultableUIntFt = None):
         def get_field_type(user_ft: Optional[Union[str, _FieldType]],
                            create_default_ft: Callable[[], _FieldType]) -> _OptFt:
             if user_ft == DEFAULT_FIELD_TYPE:
@@ -683,15 +882,21 @@ class TraceTypeFeatures:
         def create_default_dst_id_ft():
             return UnsignedIntegerFieldType(64)
 
-        self._magic_field_type = typing.cast(_OptUIntFt, get_field_type(magic_field_type, create_default_magic_ft))
+        def create_default_ds_id_ft():
+            return UnsignedIntegerFieldType(64)
+
+        self._magic_field_type = typing.cast(_OptFeatureUIntFt, get_field_type(magic_field_type, create_default_magic_ft))
         self._uuid_field_type = typing.cast(Optional[StaticArrayFieldType],
                                             get_field_type(uuid_field_type, create_default_uuid_ft))
-        self._data_stream_type_id_field_type = typing.cast(_OptUIntFt,
+        self._data_stream_type_id_field_type = typing.cast(_OptFeatureUIntFt,
                                                            get_field_type(data_stream_type_id_field_type,
                                                                           create_default_dst_id_ft))
+        self._data_stream_id_field_type = typing.cast(_OptFeatureUIntFt,
+                                                      get_field_type(data_stream_id_field_type,
+                                                                     create_default_ds_id_ft))
 
     @property
-    def magic_field_type(self) -> _OptUIntFt:
+    def magic_field_type(self) -> _OptFeatureUIntFt:
         return self._magic_field_type
 
     @property
@@ -699,9 +904,13 @@ class TraceTypeFeatures:
         return self._uuid_field_type
 
     @property
-    def data_stream_type_id_field_type(self) -> _OptUIntFt:
+    def data_stream_type_id_field_type(self) -> _OptFeatureUIntFt:
         return self._data_stream_type_id_field_type
 
+    @property
+    def data_stream_id_field_type(self) -> _OptFeatureUIntFt:
+        return self._data_stream_id_field_type
+
 
 class _TraceType:
     def __init__(self, trace_byte_order: ByteOrder, data_stream_types: Set[DataStreamType],
@@ -716,6 +925,7 @@ class _TraceType:
 
         self._uuid = uuid
         self._set_features(features)
+        self._set_auto_feature_fts()
         self._set_pkt_header_ft()
 
     def _set_features(self, features: Optional[TraceTypeFeatures]):
@@ -727,6 +937,27 @@ class _TraceType:
         uuid_ft = None if self._uuid is None else DEFAULT_FIELD_TYPE
         self._features = TraceTypeFeatures(uuid_field_type=uuid_ft)
 
+    # Replaces the features with a copy of which the automatic feature
+    # field types are unsigned integer field types having the minimal
+    # sizes, considering:
+    #
+    # Magic number:
+    #     32 bits (CTF magic number).
+    #
+    # Data stream type ID:
+    #     The number of data stream types.
+    #
+    # Data stream ID:
+    #     64 bits (any ID).
+    def _set_auto_feature_fts(self):
+        features = self._features
+        self._features = TraceTypeFeatures(_sized_auto_feature_uint_ft(features.magic_field_type, 2 ** 32 - 1),
+                                           features.uuid_field_type,
+                                           _sized_auto_feature_uint_ft(features.data_stream_type_id_field_type,
+                                                                       len(self._data_stream_types) - 1),
+                                           _sized_auto_feature_uint_ft(features.data_stream_id_field_type,
+                                                                       2 ** 64 - 1))
+
     def _set_pkt_header_ft(self):
         members = collections.OrderedDict()
 
@@ -739,6 +970,7 @@ class _TraceType:
         add_member_if_exists('magic', self._features.magic_field_type)
         add_member_if_exists('uuid', self._features.uuid_field_type)
         add_member_if_exists('stream_id', self._features.data_stream_type_id_field_type)
+        add_member_if_exists('stream_instance_id', self._features.data_stream_id_field_type)
         self._pkt_header_ft = StructureFieldType(8, members)
 
     @property
@@ -872,9 +1104,11 @@ class ClockTypeCTypes(collections.abc.Mapping):
 
 class ConfigurationCodeGenerationHeaderOptions:
     def __init__(self, identifier_prefix_definition: bool = False,
-                 default_data_stream_type_name_definition: bool = False):
+                 default_data_stream_type_name_definition: bool = False,
+                 inline_guards: bool = False):
         self._identifier_prefix_definition = identifier_prefix_definition
         self._default_data_stream_type_name_definition = default_data_stream_type_name_definition
+        self._inline_guards = inline_guards
 
     @property
     def identifier_prefix_definition(self) -> bool:
@@ -884,15 +1118,37 @@ class ConfigurationCodeGenerationHeaderOptions:
     def default_data_stream_type_name_definition(self) -> bool:
         return self._default_data_stream_type_name_definition
 
+    @property
+    def inline_guards(self) -> bool:
+        return self._inline_guards
+
 
 class ConfigurationCodeGenerationOptions:
     def __init__(self, identifier_prefix: str = 'barectf_', file_name_prefix: str = 'barectf',
                  default_data_stream_type: Optional[DataStreamType] = None,
                  header_options: Optional[ConfigurationCodeGenerationHeaderOptions] = None,
-                 clock_type_c_types: Optional[_ClkTypeCTypes] = None):
+                 clock_type_c_types: Optional[_ClkTypeCTypes] = None,
+                 byte_pointer_serialization: bool = False,
+                 payload_structures: bool = False,
+                 flight_recorder: bool = False,
+                 packet_ring: bool = False,
+                 multi_producer: bool = False,
+                 nested_tracing: bool = False,
+                 statistics: bool = False,
+                 runtime_filtering: bool = False,
+                 fragmentation: bool = False):
         self._identifier_prefix = identifier_prefix
         self._file_name_prefix = file_name_prefix
         self._default_data_stream_type = default_data_stream_type
+        self._byte_pointer_serialization = byte_pointer_serialization
+        self._payload_structures = payload_structures
+        self._flight_recorder = flight_recorder
+        self._packet_ring = packet_ring
+        self._multi_producer = multi_producer
+        self._nested_tracing = nested_tracing
+        self._statistics = statistics
+        self._runtime_filtering = runtime_filtering
+        self._fragmentation = fragmentation
 
         self._header_options = ConfigurationCodeGenerationHeaderOptions()
 
@@ -924,6 +1180,42 @@ class ConfigurationCodeGenerationOptions:
     def clock_type_c_types(self) -> ClockTypeCTypes:
         return self._clock_type_c_types
 
+    @property
+    def byte_pointer_serialization(self) -> bool:
+        return self._byte_pointer_serialization
+
+    @property
+    def payload_structures(self) -> bool:
+        return self._payload_structures
+
+    @property
+    def flight_recorder(self) -> bool:
+        return self._flight_recorder
+
+    @property
+    def packet_ring(self) -> bool:
+        return self._packet_ring
+
+    @property
+    def multi_producer(self) -> bool:
+        return self._multi_producer
+
+    @property
+    def nested_tracing(self) -> bool:
+        return self._nested_tracing
+
+    @property
+    def statistics(self) -> bool:
+        return self._statistics
+
+    @property
+    def runtime_filtering(self) -> bool:
+        return self._runtime_filtering
+
+    @property
+    def fragmentation(self) -> bool:
+        return self._fragmentation
+
 
 class ConfigurationOptions:
     def __init__(self,
@@ -946,9 +1238,13 @@ class Configuration:
         if options is not None:
             self._options = options
 
-        clk_type_c_types = self._options.code_generation_options.clock_type_c_types
+        cg_opts = self._options.code_generation_options
+        clk_type_c_types = cg_opts.clock_type_c_types
 
         for dst in trace.type.data_stream_types:
+            if cg_opts.fragmentation and FRAGMENT_EVENT_RECORD_TYPE_NAME not in {ert.name for ert in dst.event_record_types}:
+                raise ValueError(f'Data stream type `{dst.name}` has no `{FRAGMENT_EVENT_RECORD_TYPE_NAME}` event record type, which the fragmentation code generation option requires (see create_fragment_event_record_type())')
+
             def_clk_type = dst.default_clock_type
 
             if def_clk_type is None:
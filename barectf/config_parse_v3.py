@@ -34,6 +34,11 @@ from typing import Optional, List, Dict, Any, TextIO, Set, Iterable, Callable, T
 import typing
 
 
+# Feature field type node value for an automatic feature field type
+# (`barectf_config.AUTO_FIELD_TYPE`).
+_AUTO_FEATURE_FT_NODE = 'auto'
+
+
 # A barectf 3 YAML configuration parser.
 #
 # When you build such a parser, it parses the configuration node `node`
@@ -379,6 +384,15 @@ class _Parser(barectf_config_parse_common._Parser):
             # satisfy static type checker (never reached)
             raise
 
+    # `True` if the fragmentation code generation option is enabled.
+    #
+    # _create_dst() needs this before _create_config() creates the
+    # options.
+    @property
+    def _fragmentation(self) -> bool:
+        code_gen_opts_node = self.config_node.get('options', {}).get('code-generation', {})
+        return code_gen_opts_node.get('fragmentation', False)
+
     # Returns the effective feature field type for the field type
     # node `parent_node[key]`, if any.
     #
@@ -390,6 +404,9 @@ class _Parser(barectf_config_parse_common._Parser):
     # If `parent_node[key]` is `True`:
     #     `barectf_config.DEFAULT_FIELD_TYPE`.
     #
+    # If `parent_node[key]` is `auto`:
+    #     `barectf_config.AUTO_FIELD_TYPE`.
+    #
     # If `parent_node[key]` doesn't exist:
     #     `none` (parameter).
     #
@@ -411,6 +428,10 @@ class _Parser(barectf_config_parse_common._Parser):
             # disabled feature
             return None
 
+        if ft_node == _AUTO_FEATURE_FT_NODE:
+            # automatic feature field type
+            return barectf_config.AUTO_FIELD_TYPE
+
         assert type(ft_node) is collections.OrderedDict
         return self._create_fts(ft_node)[0]
 
@@ -438,7 +459,10 @@ class _Parser(barectf_config_parse_common._Parser):
             pkt_disc_er_counter_snap_ft = barectf_config.DEFAULT_FIELD_TYPE
             ert_id_ft = barectf_config.DEFAULT_FIELD_TYPE
             ert_ts_ft = None
+            er_compact_header = False
             pkt_seq_num_ft = None
+            pkt_max_total_size = None
+            max_ts_delta = None
 
             if def_clk_type is not None:
                 # The data stream type has a default clock type.
@@ -457,6 +481,8 @@ class _Parser(barectf_config_parse_common._Parser):
             features_node = dst_node.get('$features')
 
             if features_node is not None:
+                max_ts_delta = features_node.get('maximum-timestamp-delta')
+
                 # create packet feature field types
                 pkt_node = features_node.get('packet')
 
@@ -475,6 +501,7 @@ class _Parser(barectf_config_parse_common._Parser):
                                                                    pkt_disc_er_counter_snap_ft)
                     pkt_seq_num_ft = self._feature_ft(pkt_node, 'sequence-number-field-type',
                                                       pkt_seq_num_ft)
+                    pkt_max_total_size = pkt_node.get('maximum-total-size')
 
                 # create event record feature field types
                 er_node = features_node.get('event-record')
@@ -483,10 +510,15 @@ class _Parser(barectf_config_parse_common._Parser):
                 if er_node is not None:
                     ert_id_ft = self._feature_ft(er_node, type_id_ft_prop_name, ert_id_ft)
                     ert_ts_ft = self._feature_ft(er_node, 'timestamp-field-type', ert_ts_ft)
+                    er_compact_header = er_node.get('compact-header', False)
 
             erts_prop_name = 'event-record-types'
             ert_count = len(dst_node[erts_prop_name])
 
+            if self._fragmentation:
+                # fragment event record type
+                ert_count += 1
+
             try:
                 if ert_id_ft is None and ert_count > 1:
                     raise _ConfigurationParseError(f'`{type_id_ft_prop_name}` property',
@@ -498,6 +530,23 @@ class _Parser(barectf_config_parse_common._Parser):
                     if ert_count > (1 << ert_id_int_ft.size):
                         raise _ConfigurationParseError(f'`{type_id_ft_prop_name}` property',
                                                        f'Field type\'s size ({ert_id_int_ft.size} bits) is too small to accomodate {ert_count} event record types')
+
+                if er_compact_header:
+                    if ert_id_ft is None or ert_ts_ft is None:
+                        raise _ConfigurationParseError('`compact-header` property',
+                                                       'Compact event record header feature requires both the event record type ID and timestamp field type features')
+
+                    # default field types are 64-bit, byte-aligned
+                    # unsigned integer field types
+                    if isinstance(ert_ts_ft, barectf_config._IntegerFieldType):
+                        if ert_ts_ft.size < 27:
+                            raise _ConfigurationParseError('`compact-header` property',
+                                                           f'Compact event record header feature requires a timestamp field type of at least 27 bits (got {ert_ts_ft.size} bits)')
+
+                    for ft in (ert_id_ft, ert_ts_ft):
+                        if isinstance(ft, barectf_config._IntegerFieldType) and ft.alignment > 8:
+                            raise _ConfigurationParseError('`compact-header` property',
+                                                           'Compact event record header feature requires event record type ID and timestamp field types with an alignment of at most 8 bits')
             except _ConfigurationParseError as exc:
                 exc._append_ctx('`event-record` property')
                 _append_error_ctx(exc, '`$features` property')
@@ -507,9 +556,12 @@ class _Parser(barectf_config_parse_common._Parser):
                                                                        pkt_beginning_ts_ft,
                                                                        pkt_end_ts_ft,
                                                                        pkt_disc_er_counter_snap_ft,
-                                                                       pkt_seq_num_ft)
-            er_features = barectf_config.DataStreamTypeEventRecordFeatures(ert_id_ft, ert_ts_ft)
-            features = barectf_config.DataStreamTypeFeatures(pkt_features, er_features)
+                                                                       pkt_seq_num_ft,
+                                                                       pkt_max_total_size)
+            er_features = barectf_config.DataStreamTypeEventRecordFeatures(ert_id_ft, ert_ts_ft,
+                                                                           er_compact_header)
+            features = barectf_config.DataStreamTypeFeatures(pkt_features, er_features,
+                                                             max_ts_delta)
 
             # create packet context (structure) field type extra members
             pkt_ctx_ft_extra_members = None
@@ -547,10 +599,19 @@ class _Parser(barectf_config_parse_common._Parser):
             er_common_ctx_ft_prop_name = 'event-record-common-context-field-type'
             er_common_ctx_ft_node = dst_node.get(er_common_ctx_ft_prop_name)
             er_header_common_ctx_member_count = Count(er_header_common_ctx_member_count + self._total_struct_ft_node_members(er_common_ctx_ft_node))
-            erts = set()
+            # declaration order: event record type IDs follow it with
+            # the compact event record header feature
+            erts = []
 
             for ert_name, ert_node in dst_node[erts_prop_name].items():
-                erts.add(self._create_ert(ert_name, ert_node, er_header_common_ctx_member_count))
+                if self._fragmentation and ert_name == barectf_config.FRAGMENT_EVENT_RECORD_TYPE_NAME:
+                    raise _ConfigurationParseError(f'Event record type `{ert_name}`',
+                                                   'Event record type name is reserved by the fragmentation mode')
+
+                erts.append(self._create_ert(ert_name, ert_node, er_header_common_ctx_member_count))
+
+            if self._fragmentation:
+                erts.append(barectf_config.create_fragment_event_record_type())
 
             # create data stream type
             return barectf_config.DataStreamType(name, erts, def_clk_type, features,
@@ -619,6 +680,7 @@ class _Parser(barectf_config_parse_common._Parser):
             magic_ft = barectf_config.DEFAULT_FIELD_TYPE
             uuid_ft = None
             dst_id_ft = barectf_config.DEFAULT_FIELD_TYPE
+            ds_id_ft = None
 
             if trace_type_uuid is not None:
                 # Trace type has a UUID: initialize UUID field type to
@@ -633,6 +695,7 @@ class _Parser(barectf_config_parse_common._Parser):
                                             magic_ft)
                 uuid_ft = self._feature_ft(features_node, 'uuid-field-type', uuid_ft)
                 dst_id_ft = self._feature_ft(features_node, dst_id_ft_prop_name, dst_id_ft)
+                ds_id_ft = self._feature_ft(features_node, 'data-stream-id-field-type', ds_id_ft)
 
             dsts_prop_name = 'data-stream-types'
             dst_count = len(self._trace_type_node[dsts_prop_name])
@@ -648,7 +711,7 @@ class _Parser(barectf_config_parse_common._Parser):
             except _ConfigurationParseError as exc:
                 _append_error_ctx(exc, '`$features` property')
 
-            features = barectf_config.TraceTypeFeatures(magic_ft, uuid_ft, dst_id_ft)
+            features = barectf_config.TraceTypeFeatures(magic_ft, uuid_ft, dst_id_ft, ds_id_ft)
 
             # create data stream types
             dsts = set()
@@ -687,6 +750,58 @@ class _Parser(barectf_config_parse_common._Parser):
         except _ConfigurationParseError as exc:
             _append_error_ctx(exc, 'Trace')
 
+    # Validates that the multi-producer code generation option is
+    # compatible with the other options and with the data stream types
+    # of the trace type `trace_type`.
+    @staticmethod
+    def _validate_multi_producer(trace_type: barectf_config._TraceType, flight_recorder: bool):
+        try:
+            if flight_recorder:
+                raise _ConfigurationParseError('`multi-producer` property',
+                                               'Multi-producer mode is not compatible with the flight recorder mode')
+
+            for dst in trace_type.data_stream_types:
+                if dst.features.event_record_features.compact_header:
+                    raise _ConfigurationParseError('`multi-producer` property',
+                                                   f'Multi-producer mode is not compatible with the compact event record header feature of data stream type `{dst.name}`')
+        except _ConfigurationParseError as exc:
+            exc._append_ctx('`code-generation` property')
+            _append_error_ctx(exc, 'Configuration options')
+
+    # Validates that the nested tracing code generation option is
+    # compatible with the other options and with the data stream types
+    # of `trace_type`.
+    @staticmethod
+    def _validate_nested_tracing(trace_type: barectf_config._TraceType, multi_producer: bool):
+        try:
+            if multi_producer:
+                raise _ConfigurationParseError('`nested-tracing` property',
+                                               'Nested tracing mode is not compatible with the multi-producer mode')
+
+            for dst in trace_type.data_stream_types:
+                if dst.features.event_record_features.compact_header:
+                    raise _ConfigurationParseError('`nested-tracing` property',
+                                                   f'Nested tracing mode is not compatible with the compact event record header feature of data stream type `{dst.name}`')
+        except _ConfigurationParseError as exc:
+            exc._append_ctx('`code-generation` property')
+            _append_error_ctx(exc, 'Configuration options')
+
+    # Validates that the fragmentation code generation option is
+    # compatible with the other options.
+    @staticmethod
+    def _validate_fragmentation(multi_producer: bool, nested_tracing: bool):
+        try:
+            if multi_producer:
+                raise _ConfigurationParseError('`fragmentation` property',
+                                               'Fragmentation mode is not compatible with the multi-producer mode')
+
+            if nested_tracing:
+                raise _ConfigurationParseError('`fragmentation` property',
+                                               'Fragmentation mode is not compatible with the nested tracing mode')
+        except _ConfigurationParseError as exc:
+            exc._append_ctx('`code-generation` property')
+            _append_error_ctx(exc, 'Configuration options')
+
     def _create_config(self):
         # create trace first
         trace = self._create_trace()
@@ -727,6 +842,16 @@ class _Parser(barectf_config_parse_common._Parser):
         # create options
         iden_prefix_def = False
         def_dst_name_def = False
+        inline_guards = False
+        byte_ptr_serialization = False
+        payload_structs = False
+        flight_recorder = False
+        packet_ring = False
+        multi_producer = False
+        nested_tracing = False
+        statistics = False
+        runtime_filtering = False
+        fragmentation = False
         opts_node = self.config_node.get('options')
         iden_prefix = 'barectf_'
         file_name_prefix = 'barectf'
@@ -751,12 +876,42 @@ class _Parser(barectf_config_parse_common._Parser):
                     iden_prefix_def = header_opts.get('identifier-prefix-definition', False)
                     def_dst_name_def = header_opts.get('default-data-stream-type-name-definition',
                                                        False)
+                    inline_guards = header_opts.get('inline-guards', False)
+
+                byte_ptr_serialization = code_gen_opts_node.get('byte-pointer-serialization', False)
+                payload_structs = code_gen_opts_node.get('payload-structures', False)
+                flight_recorder = code_gen_opts_node.get('flight-recorder', False)
+                packet_ring = code_gen_opts_node.get('packet-ring', False)
+                multi_producer = code_gen_opts_node.get('multi-producer', False)
+                nested_tracing = code_gen_opts_node.get('nested-tracing', False)
+                statistics = code_gen_opts_node.get('statistics', False)
+                runtime_filtering = code_gen_opts_node.get('runtime-filtering', False)
+                fragmentation = code_gen_opts_node.get('fragmentation', False)
+
+                if multi_producer:
+                    self._validate_multi_producer(trace.type, flight_recorder)
+
+                if nested_tracing:
+                    self._validate_nested_tracing(trace.type, multi_producer)
+
+                if fragmentation:
+                    self._validate_fragmentation(multi_producer, nested_tracing)
 
         header_opts = barectf_config.ConfigurationCodeGenerationHeaderOptions(iden_prefix_def,
-                                                                              def_dst_name_def)
+                                                                              def_dst_name_def,
+                                                                              inline_guards)
         cg_opts = barectf_config.ConfigurationCodeGenerationOptions(iden_prefix, file_name_prefix,
                                                                     def_dst, header_opts,
-                                                                    clk_type_c_types)
+                                                                    clk_type_c_types,
+                                                                    byte_ptr_serialization,
+                                                                    payload_structs,
+                                                                    flight_recorder,
+                                                                    packet_ring,
+                                                                    multi_producer,
+                                                                    nested_tracing,
+                                                                    statistics,
+                                                                    runtime_filtering,
+                                                                    fragmentation)
         opts = barectf_config.ConfigurationOptions(cg_opts)
 
         # create configuration
@@ -783,6 +938,14 @@ class _Parser(barectf_config_parse_common._Parser):
 
             self._resolve_ft_alias_from(ft_aliases_node, parent_node, key)
 
+        # Like resolve_ft_alias_from(), but keeps an automatic feature
+        # field type node unless a field type alias has the same name.
+        def resolve_feature_ft_alias_from(parent_node: _MapNode, key: str):
+            if parent_node.get(key) == _AUTO_FEATURE_FT_NODE and _AUTO_FEATURE_FT_NODE not in ft_aliases_node:
+                return
+
+            resolve_ft_alias_from(parent_node, key)
+
         ft_aliases_node = self._trace_type_node['$field-type-aliases']
 
         # Expand field type aliases within trace, data stream, and event
@@ -796,7 +959,8 @@ class _Parser(barectf_config_parse_common._Parser):
                 try:
                     resolve_ft_alias_from(features_node, 'magic-field-type')
                     resolve_ft_alias_from(features_node, 'uuid-field-type')
-                    resolve_ft_alias_from(features_node, 'data-stream-type-id-field-type')
+                    resolve_feature_ft_alias_from(features_node, 'data-stream-type-id-field-type')
+                    resolve_ft_alias_from(features_node, 'data-stream-id-field-type')
                 except _ConfigurationParseError as exc:
                     _append_error_ctx(exc, f'`{features_prop_name}` property')
         except _ConfigurationParseError as exc:
@@ -813,13 +977,13 @@ class _Parser(barectf_config_parse_common._Parser):
 
                         if pkt_node is not None:
                             try:
-                                resolve_ft_alias_from(pkt_node, 'total-size-field-type')
-                                resolve_ft_alias_from(pkt_node, 'content-size-field-type')
-                                resolve_ft_alias_from(pkt_node, 'beginning-timestamp-field-type')
-                                resolve_ft_alias_from(pkt_node, 'end-timestamp-field-type')
-                                resolve_ft_alias_from(pkt_node,
-                                                      'discarded-event-records-counter-snapshot-field-type')
-                                resolve_ft_alias_from(pkt_node, 'sequence-number-field-type')
+                                resolve_feature_ft_alias_from(pkt_node, 'total-size-field-type')
+                                resolve_feature_ft_alias_from(pkt_node, 'content-size-field-type')
+                                resolve_feature_ft_alias_from(pkt_node, 'beginning-timestamp-field-type')
+                                resolve_feature_ft_alias_from(pkt_node, 'end-timestamp-field-type')
+                                resolve_feature_ft_alias_from(pkt_node,
+                                                              'discarded-event-records-counter-snapshot-field-type')
+                                resolve_feature_ft_alias_from(pkt_node, 'sequence-number-field-type')
                             except _ConfigurationParseError as exc:
                                 _append_error_ctx(exc, f'`{pkt_prop_name}` property')
 
@@ -828,8 +992,8 @@ class _Parser(barectf_config_parse_common._Parser):
 
                         if er_node is not None:
                             try:
-                                resolve_ft_alias_from(er_node, 'type-id-field-type')
-                                resolve_ft_alias_from(er_node, 'timestamp-field-type')
+                                resolve_feature_ft_alias_from(er_node, 'type-id-field-type')
+                                resolve_feature_ft_alias_from(er_node, 'timestamp-field-type')
                             except _ConfigurationParseError as exc:
                                 _append_error_ctx(exc, f'`{er_prop_name}` property')
                     except _ConfigurationParseError as exc:
@@ -884,6 +1048,7 @@ class _Parser(barectf_config_parse_common._Parser):
             apply_ft_inheritance(features_node, 'magic-field-type')
             apply_ft_inheritance(features_node, 'uuid-field-type')
             apply_ft_inheritance(features_node, 'data-stream-type-id-field-type')
+            apply_ft_inheritance(features_node, 'data-stream-id-field-type')
 
         for dst_node in self._trace_type_node['data-stream-types'].values():
             features_node = dst_node.get(features_prop_name)
@@ -974,6 +1139,7 @@ class _Parser(barectf_config_parse_common._Parser):
             normalize_struct_ft_member_nodes(features_node, 'magic-field-type')
             normalize_struct_ft_member_nodes(features_node, 'uuid-field-type')
             normalize_struct_ft_member_nodes(features_node, 'data-stream-type-id-field-type')
+            normalize_struct_ft_member_nodes(features_node, 'data-stream-id-field-type')
 
         for dst_node in self._trace_type_node['data-stream-types'].values():
             features_node = dst_node.get(features_prop_name)
@@ -26,6 +26,7 @@
 #include <stdio.h>
 #include <stdlib.h>
 #include <stdint.h>
+#include <string.h>
 #include <assert.h>
 #include <time.h>
 
@@ -110,6 +111,7 @@ struct barectf_platform_linux_fs_ctx *barectf_platform_linux_fs_init(
 	struct barectf_platform_linux_fs_ctx *platform_ctx;
 	struct barectf_platform_callbacks cbs;
 
+	memset(&cbs, 0, sizeof(cbs));
 	cbs.default_clock_get_value = get_clock;
 	cbs.is_backend_full = is_backend_full;
 	cbs.open_packet = open_packet;
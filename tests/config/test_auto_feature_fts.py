@@ -0,0 +1,77 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2020 Philippe Proulx <pproulx@efficios.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import barectf
+
+
+def _erts(count):
+    return {barectf.EventRecordType(f'ev{i}') for i in range(count)}
+
+
+# Tests that data stream types which share feature objects having
+# automatic field types each get their own field type sizes, without
+# modifying the shared objects.
+def test_shared_dst_features():
+    clk_type = barectf.ClockType('default')
+    pkt_features = barectf.DataStreamTypePacketFeatures(barectf.AUTO_FIELD_TYPE,
+                                                        barectf.AUTO_FIELD_TYPE,
+                                                        maximum_total_size=barectf.Count(256))
+    er_features = barectf.DataStreamTypeEventRecordFeatures(barectf.AUTO_FIELD_TYPE,
+                                                            barectf.AUTO_FIELD_TYPE)
+    features = barectf.DataStreamTypeFeatures(pkt_features, er_features, 1)
+    dst_a = barectf.DataStreamType('a', _erts(2), clk_type, features)
+    dst_b = barectf.DataStreamType('b', _erts(20), clk_type, features)
+
+    # type ID sizes from the event record type counts
+    assert dst_a.features.event_record_features.type_id_field_type.size == 1
+    assert dst_b.features.event_record_features.type_id_field_type.size == 5
+
+    # other sizes are the same for both data stream types
+    for dst in (dst_a, dst_b):
+        assert dst.features.packet_features.total_size_field_type.size == 12
+        assert dst.features.packet_features.content_size_field_type.size == 12
+
+        # 1 GHz default clock: 1 s between two timestamps
+        assert dst.features.event_record_features.timestamp_field_type.size == 30
+        assert dst.features.packet_features.maximum_total_size == 256
+
+    # shared feature objects are left as is
+    assert features.event_record_features is er_features
+    assert er_features.type_id_field_type == barectf.AUTO_FIELD_TYPE
+    assert er_features.timestamp_field_type == barectf.AUTO_FIELD_TYPE
+    assert pkt_features.total_size_field_type == barectf.AUTO_FIELD_TYPE
+    assert pkt_features.content_size_field_type == barectf.AUTO_FIELD_TYPE
+
+
+# Tests that trace types which share a feature object having an
+# automatic data stream type ID field type each get their own field
+# type size, without modifying the shared object.
+def test_shared_trace_type_features():
+    features = barectf.TraceTypeFeatures(data_stream_type_id_field_type=barectf.AUTO_FIELD_TYPE)
+    dsts_1 = {barectf.DataStreamType('a', _erts(1))}
+    dsts_2 = {barectf.DataStreamType(f'dst{i}', _erts(1)) for i in range(9)}
+    trace_type_1 = barectf.TraceType(barectf.ByteOrder.LITTLE_ENDIAN, dsts_1, features=features)
+    trace_type_2 = barectf.TraceType(barectf.ByteOrder.LITTLE_ENDIAN, dsts_2, features=features)
+    assert trace_type_1.features.data_stream_type_id_field_type.size == 1
+    assert trace_type_2.features.data_stream_type_id_field_type.size == 4
+    assert features.data_stream_type_id_field_type == barectf.AUTO_FIELD_TYPE
@@ -0,0 +1,91 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2020 Philippe Proulx <pproulx@efficios.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import io
+
+import barectf
+
+
+_NAMES = ['zeta', 'alpha', 'mid']
+
+
+def _ert_ids(dst):
+    return {ert.name: ert.id for ert in dst.event_record_types}
+
+
+def _dst(compact_header):
+    er_features = barectf.DataStreamTypeEventRecordFeatures(barectf.DEFAULT_FIELD_TYPE,
+                                                            barectf.DEFAULT_FIELD_TYPE,
+                                                            compact_header=compact_header)
+    features = barectf.DataStreamTypeFeatures(event_record_features=er_features)
+    erts = [barectf.EventRecordType(name) for name in _NAMES]
+    return barectf.DataStreamType('default', erts, barectf.ClockType('default'), features)
+
+
+# Tests that event record type IDs follow the names by default.
+def test_ids_follow_names():
+    assert _ert_ids(_dst(False)) == {'alpha': 0, 'mid': 1, 'zeta': 2}
+
+
+# Tests that event record type IDs follow the given order with the
+# compact event record header feature.
+def test_compact_header_ids_follow_order():
+    assert _ert_ids(_dst(True)) == {'zeta': 0, 'alpha': 1, 'mid': 2}
+
+
+# Tests that, with the compact event record header feature, event
+# record type IDs follow the YAML declaration order, the fragment
+# event record type having the last one.
+def test_compact_header_ids_follow_yaml_order():
+    erts = ''.join(f'''
+          {name}:
+            payload-field-type:
+              class: struct
+              members:
+                - x: uint8''' for name in _NAMES)
+    cfg = barectf.configuration_from_file(io.StringIO(f'''--- !<tag:barectf.org,2020/3/config>
+options:
+  code-generation:
+    fragmentation: true
+trace:
+  type:
+    $include: [stdint.yaml]
+    native-byte-order: le
+    clock-types:
+      default: {{}}
+    data-stream-types:
+      default:
+        $is-default: true
+        $default-clock-type-name: default
+        $features:
+          event-record:
+            compact-header: true
+        event-record-types:{erts}
+'''))
+    dst = next(iter(cfg.trace.type.data_stream_types))
+    assert _ert_ids(dst) == {
+        'zeta': 0,
+        'alpha': 1,
+        'mid': 2,
+        barectf.FRAGMENT_EVENT_RECORD_TYPE_NAME: 3,
+    }
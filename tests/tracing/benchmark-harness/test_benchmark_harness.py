@@ -0,0 +1,100 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2020 Philippe Proulx <pproulx@efficios.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import os.path
+import re
+import subprocess
+import sys
+import barectf
+import barectf.cli
+
+
+# Compiles the generated tracer and benchmark harness within `build_dir`
+# and runs the harness, returning its report lines.
+def _build_and_run(build_dir):
+    cc = os.environ.get('CC', 'cc')
+
+    # the harness must build without warnings
+    subprocess.check_output([cc, '-c', '-Wall', '-Wextra', '-Werror', '-pedantic',
+                             '-DBENCH_EVENT_COUNT=10000UL', 'barectf-benchmark.c'],
+                            cwd=build_dir, text=True, stderr=subprocess.STDOUT)
+    subprocess.check_output([cc, '-c', 'barectf.c'], cwd=build_dir, text=True,
+                            stderr=subprocess.STDOUT)
+    subprocess.check_output([cc, '-o', 'benchmark', 'barectf-benchmark.o', 'barectf.o'],
+                            cwd=build_dir, text=True, stderr=subprocess.STDOUT)
+    output = subprocess.check_output([os.path.join(build_dir, 'benchmark')], cwd=build_dir,
+                                     text=True)
+    return output.splitlines()
+
+
+# Validates the report lines of the benchmark harness which
+# `_build_and_run()` returns.
+def _check_report(lines):
+    line_pattern = re.compile(r'^default/(\w+): ([\d.]+) ns/event, ([\d.]+) bytes/event, '
+                              r'([\d.]+) events/packet$')
+    erts = []
+
+    for line in lines:
+        m = line_pattern.match(line)
+        assert m, line
+        erts.append(m.group(1))
+        assert float(m.group(3)) > 0
+
+        # Only full packets count: all the event records of `fixed`
+        # have the same size, so that each full packet contains the
+        # same number of them.
+        events_per_packet = float(m.group(4))
+        assert events_per_packet > 0
+
+        if m.group(1) == 'fixed':
+            assert events_per_packet == int(events_per_packet)
+
+    assert erts == ['dynamic', 'fixed']
+
+
+def _cfg_path(request):
+    return os.path.join(os.path.dirname(request.fspath), 'config.yaml')
+
+
+# Tests CodeGenerator.generate_benchmark_harness().
+def test_generate_benchmark_harness(request, tmpdir):
+    with open(_cfg_path(request)) as f:
+        cfg = barectf.configuration_from_file(f)
+
+    cg = barectf.CodeGenerator(cfg)
+
+    for file in cg.generate_c_headers() + cg.generate_c_sources() + [cg.generate_benchmark_harness()]:
+        with open(os.path.join(tmpdir, file.name), 'w') as f:
+            f.write(file.contents)
+
+    _check_report(_build_and_run(str(tmpdir)))
+
+
+# Tests the `--benchmark-harness` option of the `generate` command.
+def test_cli_benchmark_harness(request, tmpdir, monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['barectf', 'generate', '--benchmark-harness',
+                                      f'--code-dir={tmpdir}', f'--headers-dir={tmpdir}',
+                                      f'--metadata-dir={tmpdir}', _cfg_path(request)])
+    barectf.cli._run()
+    assert os.path.isfile(os.path.join(tmpdir, 'barectf-benchmark.c'))
+    _check_report(_build_and_run(str(tmpdir)))
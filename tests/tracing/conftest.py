@@ -61,6 +61,9 @@ def pytest_collect_file(parent, path):
         'counter-clock',
         'basic-extra-pc-ft-members',
         'packet-set-buf',
+        'flight-recorder',
+        'packet-ring',
+        'nested-tracing',
     }
 
     if cat not in valid_cats or os.path.basename(configs_dir) != 'configs':
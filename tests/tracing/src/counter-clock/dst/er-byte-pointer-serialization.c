@@ -0,0 +1,54 @@
+/*
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2020 Philippe Proulx <pproulx@efficios.com>
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining
+ * a copy of this software and associated documentation files (the
+ * "Software"), to deal in the Software without restriction, including
+ * without limitation the rights to use, copy, modify, merge, publish,
+ * distribute, sublicense, and/or sell copies of the Software, and to
+ * permit persons to whom the Software is furnished to do so, subject to
+ * the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+ * BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+ * ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+#include <assert.h>
+#include <stdint.h>
+
+#include "test-platform.h"
+#include "barectf.h"
+
+int main(void)
+{
+	struct test_platform_ctx * const platform_ctx = test_platform_init(128);
+	struct barectf_default_ctx *ctx;
+	const uint32_t arr[] = {0xdeadbeef, 0x01234567, 0xcafebabe};
+	const int16_t sarr[] = {-1, 2, -3};
+	unsigned int i;
+
+	assert(platform_ctx);
+	ctx = test_platform_barectf_ctx(platform_ctx);
+	assert(ctx);
+
+	for (i = 0; i < 8; i++) {
+		barectf_trace_ev_a(ctx, i % 2 ? "ctx" : "", 0x1234 + i, 42 + i,
+			0xabcdef - i, -100000 + i, 1.5 * i, i % 4, arr, sarr,
+			i % 2 ? "hello" : "", UINT64_C(0x0102030405060708) + i);
+		barectf_trace_ev_b(ctx, "", 7 * i, 0xaa, 0x55667788);
+	}
+
+	test_platform_fini(platform_ctx);
+	return 0;
+}
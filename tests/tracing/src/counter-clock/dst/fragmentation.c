@@ -0,0 +1,63 @@
+/*
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2020 Philippe Proulx <pproulx@efficios.com>
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining
+ * a copy of this software and associated documentation files (the
+ * "Software"), to deal in the Software without restriction, including
+ * without limitation the rights to use, copy, modify, merge, publish,
+ * distribute, sublicense, and/or sell copies of the Software, and to
+ * permit persons to whom the Software is furnished to do so, subject to
+ * the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+ * BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+ * ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+#include <assert.h>
+#include <stdint.h>
+
+#include "test-platform.h"
+#include "barectf.h"
+
+int main(void)
+{
+	struct test_platform_ctx * const platform_ctx = test_platform_init(128);
+	struct barectf_default_ctx *ctx;
+	uint8_t blob[300];
+	uint32_t i;
+
+	assert(platform_ctx);
+	ctx = test_platform_barectf_ctx(platform_ctx);
+	assert(ctx);
+
+	for (i = 0; i < sizeof(blob); i++) {
+		blob[i] = (uint8_t) i;
+	}
+
+	barectf_trace_ev(ctx, 0, 23);
+
+	/* Blob spanning many packets, appended in two parts */
+	barectf_begin_blob(ctx);
+	barectf_append_blob(ctx, 1, blob, 200);
+	barectf_append_blob(ctx, 1, &blob[200], 100);
+	barectf_end_blob(ctx, 1);
+	barectf_trace_ev(ctx, 0, 42);
+
+	/* Small blob which fits the current packet */
+	barectf_begin_blob(ctx);
+	barectf_append_blob(ctx, 2, blob, 8);
+	barectf_end_blob(ctx, 2);
+	test_platform_fini(platform_ctx);
+	return 0;
+}
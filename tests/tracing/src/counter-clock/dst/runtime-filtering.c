@@ -0,0 +1,66 @@
+/*
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2020 Philippe Proulx <pproulx@efficios.com>
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining
+ * a copy of this software and associated documentation files (the
+ * "Software"), to deal in the Software without restriction, including
+ * without limitation the rights to use, copy, modify, merge, publish,
+ * distribute, sublicense, and/or sell copies of the Software, and to
+ * permit persons to whom the Software is furnished to do so, subject to
+ * the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+ * BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+ * ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+#include <assert.h>
+#include <stdint.h>
+
+#include "test-platform.h"
+#include "barectf.h"
+
+int main(void)
+{
+	struct test_platform_ctx * const platform_ctx = test_platform_init(512);
+	struct barectf_default_ctx *ctx;
+
+	assert(platform_ctx);
+	ctx = test_platform_barectf_ctx(platform_ctx);
+	assert(ctx);
+	assert(barectf_is_event_record_type_enabled(ctx, BARECTF_default_a_ID));
+	assert(barectf_is_event_record_type_enabled(ctx, BARECTF_default_dummy_ID));
+	assert(!barectf_is_event_record_type_enabled(ctx, 8));
+	assert(barectf_min_log_level(ctx) == UINT32_C(0xffffffff));
+	barectf_trace_a(ctx, 1);
+	barectf_trace_b(ctx, 2);
+	barectf_trace_c(ctx, 3);
+
+	/* Disable `b` */
+	barectf_enable_event_record_type(ctx, BARECTF_default_b_ID, 0);
+	assert(!barectf_is_event_record_type_enabled(ctx, BARECTF_default_b_ID));
+	barectf_trace_a(ctx, 4);
+	barectf_trace_b(ctx, 5);
+	barectf_trace_c(ctx, 6);
+
+	/* Enable `b`, but filter out log levels above `WARNING` */
+	barectf_enable_event_record_type(ctx, BARECTF_default_b_ID, 1);
+	assert(barectf_is_event_record_type_enabled(ctx, BARECTF_default_b_ID));
+	barectf_set_min_log_level(ctx, 4);
+	assert(barectf_min_log_level(ctx) == 4);
+	barectf_trace_a(ctx, 7);
+	barectf_trace_b(ctx, 8);
+	barectf_trace_c(ctx, 9);
+	test_platform_fini(platform_ctx);
+	return 0;
+}
@@ -0,0 +1,68 @@
+/*
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2020 Philippe Proulx <pproulx@efficios.com>
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining
+ * a copy of this software and associated documentation files (the
+ * "Software"), to deal in the Software without restriction, including
+ * without limitation the rights to use, copy, modify, merge, publish,
+ * distribute, sublicense, and/or sell copies of the Software, and to
+ * permit persons to whom the Software is furnished to do so, subject to
+ * the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+ * BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+ * ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+#include <assert.h>
+#include <stdint.h>
+#include <string.h>
+
+#include "test-platform.h"
+#include "barectf.h"
+
+int main(void)
+{
+	struct test_platform_ctx * const platform_ctx = test_platform_init(128);
+	struct barectf_default_ctx *ctx;
+	char big_str[200];
+	uint32_t i;
+
+	assert(platform_ctx);
+	ctx = test_platform_barectf_ctx(platform_ctx);
+	assert(ctx);
+
+	for (i = 0; i < 10; i++) {
+		barectf_trace_dummy(ctx, "hello");
+		barectf_trace_ev(ctx, i);
+	}
+
+	/* Event record which can never fit a packet */
+	memset(big_str, 'x', sizeof(big_str) - 1);
+	big_str[sizeof(big_str) - 1] = '\0';
+	barectf_trace_dummy(ctx, big_str);
+
+	assert(barectf_stat_events_written(ctx) == 20);
+	assert(barectf_stat_bytes_written(ctx) >= 10 * (22 + 20));
+	assert(barectf_stat_packets_opened(ctx) ==
+		barectf_stat_packets_closed(ctx) + 1);
+	assert(barectf_stat_packet_switches(ctx) ==
+		barectf_stat_packets_closed(ctx));
+	assert(barectf_stat_packet_switches(ctx) > 0);
+	assert(barectf_stat_discarded_event_records(ctx, BARECTF_default_dummy_ID) == 1);
+	assert(barectf_stat_discarded_event_records(ctx, BARECTF_default_ev_ID) == 0);
+	assert(barectf_stat_discarded_event_records(ctx, 2) == 0);
+	assert(barectf_stat_cycles(ctx) == 0);
+	test_platform_fini(platform_ctx);
+	return 0;
+}
@@ -0,0 +1,64 @@
+/*
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2020 Philippe Proulx <pproulx@efficios.com>
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining
+ * a copy of this software and associated documentation files (the
+ * "Software"), to deal in the Software without restriction, including
+ * without limitation the rights to use, copy, modify, merge, publish,
+ * distribute, sublicense, and/or sell copies of the Software, and to
+ * permit persons to whom the Software is furnished to do so, subject to
+ * the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+ * BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+ * ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+#include <assert.h>
+#include <stdint.h>
+
+#include "test-platform.h"
+#include "barectf.h"
+
+int main(void)
+{
+	struct test_platform_ctx * const platform_ctx = test_platform_init(512);
+	struct barectf_default_ctx *ctx;
+
+	/* Little-endian payloads of `a` and `dummy` */
+	static const uint8_t a_payload[] = {0x44, 0x33, 0x22, 0x11, 0x66, 0x55};
+	static const uint8_t dummy_payload[] = {'h', 'i', '\0'};
+
+	assert(platform_ctx);
+	ctx = test_platform_barectf_ctx(platform_ctx);
+	assert(ctx);
+
+	/* Same event record, serialized and raw */
+	barectf_trace_a(ctx, 1, 0x11223344, 0x5566);
+	barectf_trace_raw(ctx, 1, BARECTF_default_a_ID, a_payload, 48);
+
+	/* Dynamic payload */
+	barectf_trace_dummy(ctx, 2, "hi");
+	barectf_trace_raw(ctx, 2, BARECTF_default_dummy_ID, dummy_payload, 24);
+
+	/* Discarded: wrong static size, specific context, unknown ID */
+	barectf_trace_raw(ctx, 3, BARECTF_default_a_ID, a_payload, 32);
+	barectf_trace_raw(ctx, 3, BARECTF_default_b_ID, a_payload, 32);
+	barectf_trace_raw(ctx, 3, 7, a_payload, 48);
+
+	/* Discarded: payload larger than a packet, wrapping size */
+	barectf_trace_raw(ctx, 4, BARECTF_default_dummy_ID, dummy_payload, 4104);
+	barectf_trace_raw(ctx, 4, BARECTF_default_dummy_ID, dummy_payload, UINT32_C(0xffffffff) - 71);
+	test_platform_fini(platform_ctx);
+	return 0;
+}
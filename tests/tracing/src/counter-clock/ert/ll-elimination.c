@@ -0,0 +1,52 @@
+/*
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2020 Philippe Proulx <pproulx@efficios.com>
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining
+ * a copy of this software and associated documentation files (the
+ * "Software"), to deal in the Software without restriction, including
+ * without limitation the rights to use, copy, modify, merge, publish,
+ * distribute, sublicense, and/or sell copies of the Software, and to
+ * permit persons to whom the Software is furnished to do so, subject to
+ * the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+ * BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+ * ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+#include <assert.h>
+#include <stdint.h>
+
+#define BARECTF_MIN_LOG_LEVEL 6
+#define BARECTF_ENABLE_default_forced 1
+
+#include "test-platform.h"
+#include "barectf.h"
+
+int main(void)
+{
+	struct test_platform_ctx * const platform_ctx = test_platform_init(512);
+	uint32_t i = 0;
+
+	assert(platform_ctx);
+	barectf_trace_info(test_platform_barectf_ctx(platform_ctx), i++);
+	barectf_trace_debug(test_platform_barectf_ctx(platform_ctx), i++);
+	barectf_trace_forced(test_platform_barectf_ctx(platform_ctx), i++);
+	barectf_trace_no_ll(test_platform_barectf_ctx(platform_ctx), i++);
+	barectf_trace_debug(test_platform_barectf_ctx(platform_ctx), i++);
+
+	/* Arguments of compiled out calls are not evaluated */
+	assert(i == 3);
+	test_platform_fini(platform_ctx);
+	return 0;
+}
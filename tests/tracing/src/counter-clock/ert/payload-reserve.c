@@ -0,0 +1,69 @@
+/*
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2020 Philippe Proulx <pproulx@efficios.com>
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining
+ * a copy of this software and associated documentation files (the
+ * "Software"), to deal in the Software without restriction, including
+ * without limitation the rights to use, copy, modify, merge, publish,
+ * distribute, sublicense, and/or sell copies of the Software, and to
+ * permit persons to whom the Software is furnished to do so, subject to
+ * the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+ * BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+ * ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+#include <assert.h>
+#include <stddef.h>
+#include <stdint.h>
+
+#include "test-platform.h"
+#include "barectf.h"
+
+int main(void)
+{
+	struct test_platform_ctx * const platform_ctx = test_platform_init(512);
+	struct barectf_default_ctx *ctx;
+	struct barectf_default_frame_payload *frame;
+	struct barectf_default_frame_payload frame_s;
+
+	assert(platform_ctx);
+	ctx = test_platform_barectf_ctx(platform_ctx);
+	assert(ctx);
+
+	/* Produce the payload in place */
+	frame = barectf_reserve_frame(ctx, "can0");
+	assert(frame);
+	frame->id = 0x123;
+	frame->dlc = 8;
+	frame->flags = 0x5a;
+	frame->crc = 0xbeef;
+	frame->data = UINT64_C(0x0102030405060708);
+	barectf_commit(ctx);
+
+	/* Same event record with the payload structure tracing function */
+	frame_s.id = 0x123;
+	frame_s.dlc = 8;
+	frame_s.flags = 0x5a;
+	frame_s.crc = 0xbeef;
+	frame_s.data = UINT64_C(0x0102030405060708);
+	barectf_trace_frame_s(ctx, "can0", &frame_s);
+
+	/* Nothing to reserve when tracing is disabled */
+	barectf_enable_tracing(ctx, 0);
+	assert(!barectf_reserve_frame(ctx, "can1"));
+	barectf_enable_tracing(ctx, 1);
+	test_platform_fini(platform_ctx);
+	return 0;
+}
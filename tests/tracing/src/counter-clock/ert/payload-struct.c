@@ -0,0 +1,68 @@
+/*
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2020 Philippe Proulx <pproulx@efficios.com>
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining
+ * a copy of this software and associated documentation files (the
+ * "Software"), to deal in the Software without restriction, including
+ * without limitation the rights to use, copy, modify, merge, publish,
+ * distribute, sublicense, and/or sell copies of the Software, and to
+ * permit persons to whom the Software is furnished to do so, subject to
+ * the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+ * BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+ * ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+#include <assert.h>
+#include <stdint.h>
+
+#include "test-platform.h"
+#include "barectf.h"
+
+int main(void)
+{
+	struct test_platform_ctx * const platform_ctx = test_platform_init(256);
+	struct barectf_default_ctx *ctx;
+	const uint16_t arr[] = {0x1234, 0x5678, 0x9abc};
+	struct barectf_default_copied_payload copied;
+	struct barectf_default_unpacked_payload unpacked;
+	unsigned int i;
+
+	assert(platform_ctx);
+	ctx = test_platform_barectf_ctx(platform_ctx);
+	assert(ctx);
+
+	for (i = 0; i < 4; i++) {
+		copied.a = 0xdeadbeef - i;
+		copied.b = 0x1234 + i;
+		copied.c = -42 - (int16_t) i;
+		copied.d = 2.5 * i;
+		copied.e = 0xa0 + i;
+		barectf_trace_copied(ctx, "scalar", copied.a, copied.b,
+			copied.c, copied.d, copied.e);
+		barectf_trace_copied_s(ctx, "struct", &copied);
+
+		unpacked.a = 0x55 + i;
+		unpacked.s = i % 2 ? "hello" : "";
+		unpacked.__arr_len = i % 4;
+		unpacked.arr = arr;
+		unpacked.b = 0xcafebabe;
+		barectf_trace_unpacked(ctx, unpacked.a, unpacked.s,
+			unpacked.__arr_len, unpacked.arr, unpacked.b);
+		barectf_trace_unpacked_s(ctx, &unpacked);
+	}
+
+	test_platform_fini(platform_ctx);
+	return 0;
+}
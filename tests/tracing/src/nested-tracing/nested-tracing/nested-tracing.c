@@ -0,0 +1,75 @@
+/*
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2020 Philippe Proulx <pproulx@efficios.com>
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining
+ * a copy of this software and associated documentation files (the
+ * "Software"), to deal in the Software without restriction, including
+ * without limitation the rights to use, copy, modify, merge, publish,
+ * distribute, sublicense, and/or sell copies of the Software, and to
+ * permit persons to whom the Software is furnished to do so, subject to
+ * the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+ * BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+ * ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+#include <assert.h>
+#include <stdint.h>
+
+#include "test-platform.h"
+#include "barectf.h"
+
+static uint8_t irq_count = 0;
+static uint8_t write_irq_count = 0;
+
+static void handle_irq(struct barectf_default_ctx * const ctx)
+{
+	/* Nested event record: reserved while an outer one is pending */
+	barectf_trace_irq(ctx, irq_count);
+	++irq_count;
+}
+
+static void handle_write_irq(struct barectf_default_ctx * const ctx)
+{
+	/*
+	 * Nested event record: reserved after an outer one, before the
+	 * outer one is written and committed.
+	 */
+	barectf_trace_irq(ctx, 100 + write_irq_count);
+	++write_irq_count;
+}
+
+int main(void)
+{
+	struct test_platform_ctx * const platform_ctx = test_platform_init(256);
+	struct barectf_default_ctx *ctx;
+	uint32_t i;
+
+	assert(platform_ctx);
+	ctx = test_platform_barectf_ctx(platform_ctx);
+	assert(ctx);
+
+	/* Leave room to two nested event records at the end of a packet */
+	barectf_set_nested_reserved_size(ctx, 24);
+	test_platform_set_interrupt(platform_ctx, handle_irq, 5);
+	test_platform_set_write_interrupt(platform_ctx, handle_write_irq, 7);
+
+	for (i = 0; i < 20; i++) {
+		barectf_trace_ev(ctx, i, "nested");
+	}
+
+	assert(write_irq_count > 0);
+	test_platform_fini(platform_ctx);
+	return 0;
+}
@@ -81,6 +81,7 @@ struct test_platform_ctx *test_platform_init(const size_t buf_size)
 	struct test_platform_ctx *platform_ctx;
 	struct barectf_platform_callbacks cbs;
 
+	memset(&cbs, 0, sizeof(cbs));
 	cbs.default_clock_get_value = get_clock_val;
 	cbs.is_backend_full = is_backend_full;
 	cbs.open_packet = open_packet;
@@ -0,0 +1,141 @@
+/*
+ * Copyright (c) 2020 Philippe Proulx <pproulx@efficios.com>
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <stdint.h>
+#include <string.h>
+#include <assert.h>
+
+#include "barectf.h"
+#include "test-platform.h"
+
+struct test_platform_ctx {
+	struct barectf_default_ctx ctx;
+	uint8_t *ring_buf;
+	size_t ring_buf_size;
+	uint64_t clock_val;
+	uint64_t snapshot_clock_val;
+};
+
+static uint64_t get_clock_val(void * const data)
+{
+	struct test_platform_ctx * const platform_ctx = (void *) data;
+	const uint64_t ret = platform_ctx->clock_val;
+
+	++platform_ctx->clock_val;
+	return ret;
+}
+
+static int is_backend_full(void * const data)
+{
+	/* Flight recorder: never consulted */
+	assert(0);
+	return 1;
+}
+
+static void open_packet(void * const data)
+{
+	struct test_platform_ctx * const platform_ctx = (void *) data;
+
+	barectf_default_open_packet(&platform_ctx->ctx);
+}
+
+static void close_packet(void * const data)
+{
+	struct test_platform_ctx * const platform_ctx = (void *) data;
+
+	if (platform_ctx->clock_val >= platform_ctx->snapshot_clock_val &&
+			barectf_is_in_tracing_section(&platform_ctx->ctx)) {
+		/* Like a fault handler which interrupts a tracing function */
+		platform_ctx->snapshot_clock_val = UINT64_MAX;
+		test_platform_snapshot(platform_ctx);
+	}
+
+	barectf_default_close_packet(&platform_ctx->ctx);
+}
+
+struct test_platform_ctx *test_platform_init(const size_t buf_size,
+		const unsigned int packet_count)
+{
+	struct test_platform_ctx *platform_ctx;
+	struct barectf_platform_callbacks cbs;
+
+	memset(&cbs, 0, sizeof(cbs));
+	cbs.default_clock_get_value = get_clock_val;
+	cbs.is_backend_full = is_backend_full;
+	cbs.open_packet = open_packet;
+	cbs.close_packet = close_packet;
+	platform_ctx = malloc(sizeof(*platform_ctx));
+	assert(platform_ctx);
+	platform_ctx->clock_val = 0;
+	platform_ctx->snapshot_clock_val = UINT64_MAX;
+	platform_ctx->ring_buf_size = buf_size * packet_count;
+	platform_ctx->ring_buf = calloc(platform_ctx->ring_buf_size, 1);
+	assert(platform_ctx->ring_buf);
+	barectf_init(&platform_ctx->ctx, platform_ctx->ring_buf, buf_size,
+		cbs, platform_ctx);
+	barectf_flight_recorder_set_ring(&platform_ctx->ctx,
+		platform_ctx->ring_buf, packet_count);
+	open_packet(platform_ctx);
+	return platform_ctx;
+}
+
+void test_platform_snapshot(struct test_platform_ctx * const platform_ctx)
+{
+	uint8_t * const buf = malloc(platform_ctx->ring_buf_size);
+	uint32_t size;
+	FILE *fh;
+
+	assert(buf);
+	size = barectf_flight_recorder_snapshot(&platform_ctx->ctx, buf,
+		platform_ctx->ring_buf_size);
+	fh = fopen("stream", "wb");
+	assert(fh);
+
+	if (size > 0) {
+		const size_t nmemb = fwrite(buf, size, 1, fh);
+
+		assert(nmemb == 1);
+	}
+
+	fclose(fh);
+	free(buf);
+}
+
+void test_platform_snapshot_at(struct test_platform_ctx * const platform_ctx,
+		const uint64_t clock_val)
+{
+	platform_ctx->snapshot_clock_val = clock_val;
+}
+
+void test_platform_fini(struct test_platform_ctx * const platform_ctx)
+{
+	free(platform_ctx->ring_buf);
+	free(platform_ctx);
+}
+
+struct barectf_default_ctx *test_platform_barectf_ctx(
+	struct test_platform_ctx * const platform_ctx)
+{
+	return &platform_ctx->ctx;
+}
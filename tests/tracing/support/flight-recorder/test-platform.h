@@ -0,0 +1,41 @@
+#ifndef _BARECTF_TEST_PLATFORM_H
+#define _BARECTF_TEST_PLATFORM_H
+
+/*
+ * Copyright (c) 2020 Philippe Proulx <pproulx@efficios.com>
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+#include <stdlib.h>
+#include <stdint.h>
+
+struct test_platform_ctx;
+struct barectf_default_ctx;
+
+struct test_platform_ctx *test_platform_init(size_t buf_size,
+	unsigned int packet_count);
+void test_platform_snapshot(struct test_platform_ctx *platform_ctx);
+void test_platform_snapshot_at(struct test_platform_ctx *platform_ctx,
+	uint64_t clock_val);
+void test_platform_fini(struct test_platform_ctx *platform_ctx);
+struct barectf_default_ctx *test_platform_barectf_ctx(
+	struct test_platform_ctx *platform_ctx);
+
+#endif /* _BARECTF_TEST_PLATFORM_H */
@@ -0,0 +1,221 @@
+/*
+ * Copyright (c) 2020 Philippe Proulx <pproulx@efficios.com>
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <stdint.h>
+#include <string.h>
+#include <assert.h>
+#include <signal.h>
+#include <unistd.h>
+#include <sys/mman.h>
+
+#include "barectf.h"
+#include "test-platform.h"
+
+struct test_platform_ctx {
+	struct barectf_default_ctx ctx;
+	FILE *fh;
+	uint64_t clock_val;
+	void (*interrupt_handler)(struct barectf_default_ctx *);
+	unsigned int interrupt_period;
+	void (*write_interrupt_handler)(struct barectf_default_ctx *);
+	unsigned int write_interrupt_period;
+	size_t buf_alloc_size;
+	int buf_is_protected;
+	int in_write_interrupt;
+};
+
+/* Platform context of the write fault handler */
+static struct test_platform_ctx *write_fault_platform_ctx;
+
+static void protect_buf(struct test_platform_ctx * const platform_ctx,
+	const int protect)
+{
+	const int ret = mprotect(barectf_packet_buf(&platform_ctx->ctx),
+		platform_ctx->buf_alloc_size,
+		protect ? PROT_READ : PROT_READ | PROT_WRITE);
+
+	assert(ret == 0);
+	platform_ctx->buf_is_protected = protect;
+}
+
+static void handle_write_fault(const int signum)
+{
+	struct test_platform_ctx * const platform_ctx = write_fault_platform_ctx;
+
+	if (!platform_ctx || !platform_ctx->buf_is_protected) {
+		/* Not a simulated interrupt: crash when retrying the access */
+		signal(signum, SIG_DFL);
+		return;
+	}
+
+	/*
+	 * Simulate an interrupt which traces after the interrupted
+	 * tracing function reserved its event record, but before it wrote
+	 * and committed it: the interrupted function resumes by retrying
+	 * its first write to the packet buffer.
+	 */
+	protect_buf(platform_ctx, 0);
+	platform_ctx->in_write_interrupt = 1;
+	platform_ctx->write_interrupt_handler(&platform_ctx->ctx);
+	platform_ctx->in_write_interrupt = 0;
+}
+
+static uint64_t get_clock_val(void * const data)
+{
+	struct test_platform_ctx * const platform_ctx = (void *) data;
+	const uint64_t ret = platform_ctx->clock_val;
+
+	++platform_ctx->clock_val;
+
+	/* Simulate an interrupt which traces while reading the clock */
+	if (platform_ctx->interrupt_handler &&
+			platform_ctx->clock_val % platform_ctx->interrupt_period == 0) {
+		platform_ctx->interrupt_handler(&platform_ctx->ctx);
+	}
+
+	/*
+	 * Arm an interrupt which the next write to the packet buffer
+	 * triggers.
+	 */
+	if (platform_ctx->write_interrupt_handler &&
+			!platform_ctx->in_write_interrupt &&
+			platform_ctx->clock_val % platform_ctx->write_interrupt_period == 0) {
+		protect_buf(platform_ctx, 1);
+	}
+
+	return ret;
+}
+
+static void write_packet(struct test_platform_ctx * const platform_ctx)
+{
+	const size_t nmemb = fwrite(barectf_packet_buf(&platform_ctx->ctx),
+		barectf_packet_buf_size(&platform_ctx->ctx), 1,
+			platform_ctx->fh);
+
+	assert(nmemb == 1);
+}
+
+static int is_backend_full(void * const data)
+{
+	return 0;
+}
+
+static void open_packet(void * const data)
+{
+	struct test_platform_ctx * const platform_ctx = (void *) data;
+
+	memset(barectf_packet_buf(&platform_ctx->ctx), 0,
+		barectf_packet_buf_size(&platform_ctx->ctx));
+	barectf_default_open_packet(&platform_ctx->ctx);
+}
+
+static void close_packet(void * const data)
+{
+	struct test_platform_ctx * const platform_ctx = (void *) data;
+
+	barectf_default_close_packet(&platform_ctx->ctx);
+	write_packet(platform_ctx);
+}
+
+struct test_platform_ctx *test_platform_init(const size_t buf_size)
+{
+	void *buf;
+	struct test_platform_ctx *platform_ctx;
+	struct barectf_platform_callbacks cbs;
+	struct sigaction sa;
+	const size_t page_size = (size_t) sysconf(_SC_PAGESIZE);
+	int ret;
+
+	memset(&cbs, 0, sizeof(cbs));
+	cbs.default_clock_get_value = get_clock_val;
+	cbs.is_backend_full = is_backend_full;
+	cbs.open_packet = open_packet;
+	cbs.close_packet = close_packet;
+	platform_ctx = malloc(sizeof(*platform_ctx));
+	assert(platform_ctx);
+	platform_ctx->clock_val = 0;
+	platform_ctx->interrupt_handler = NULL;
+	platform_ctx->interrupt_period = 0;
+	platform_ctx->write_interrupt_handler = NULL;
+	platform_ctx->write_interrupt_period = 0;
+	platform_ctx->buf_is_protected = 0;
+	platform_ctx->in_write_interrupt = 0;
+
+	/* Whole pages to write-protect the packet buffer */
+	platform_ctx->buf_alloc_size = (buf_size + page_size - 1) / page_size * page_size;
+	ret = posix_memalign(&buf, page_size, platform_ctx->buf_alloc_size);
+	assert(ret == 0);
+	write_fault_platform_ctx = platform_ctx;
+	memset(&sa, 0, sizeof(sa));
+	sa.sa_handler = handle_write_fault;
+	sigemptyset(&sa.sa_mask);
+	ret = sigaction(SIGSEGV, &sa, NULL);
+	assert(ret == 0);
+	platform_ctx->fh = fopen("stream", "wb");
+	assert(platform_ctx->fh);
+	barectf_init(&platform_ctx->ctx, buf, buf_size, cbs, platform_ctx);
+	open_packet(platform_ctx);
+	return platform_ctx;
+}
+
+void test_platform_fini(struct test_platform_ctx * const platform_ctx)
+{
+	platform_ctx->interrupt_handler = NULL;
+	platform_ctx->write_interrupt_handler = NULL;
+
+	if (platform_ctx->buf_is_protected) {
+		protect_buf(platform_ctx, 0);
+	}
+
+	if (barectf_packet_is_open(&platform_ctx->ctx)) {
+		close_packet(platform_ctx);
+	}
+
+	fclose(platform_ctx->fh);
+	free(barectf_packet_buf(&platform_ctx->ctx));
+	write_fault_platform_ctx = NULL;
+	free(platform_ctx);
+}
+
+struct barectf_default_ctx *test_platform_barectf_ctx(
+	struct test_platform_ctx * const platform_ctx)
+{
+	return &platform_ctx->ctx;
+}
+
+void test_platform_set_interrupt(struct test_platform_ctx * const platform_ctx,
+	void (* const handler)(struct barectf_default_ctx *),
+	const unsigned int period)
+{
+	platform_ctx->interrupt_handler = handler;
+	platform_ctx->interrupt_period = period;
+}
+
+void test_platform_set_write_interrupt(struct test_platform_ctx * const platform_ctx,
+	void (* const handler)(struct barectf_default_ctx *),
+	const unsigned int period)
+{
+	platform_ctx->write_interrupt_handler = handler;
+	platform_ctx->write_interrupt_period = period;
+}